@@ -6,22 +6,23 @@ Create Date: 2026-02-01 19:00:00.000000
 """
 from __future__ import annotations
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
 
 revision = "20260201190000"
 down_revision = None
 branch_labels = None
 depends_on = None
 
-
-def upgrade() -> None:
-    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
-    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
-
-    op.create_table(
+_metadata = sa.MetaData()
+# now() returns the transaction start time, so paired created_at/updated_at
+# defaults share a single clock read per insert; no trigger is needed.
+_TABLES = (
+    sa.Table(
         "theses",
+        _metadata,
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -50,10 +51,10 @@ def upgrade() -> None:
         sa.Column("current_price", sa.Numeric()),
         sa.Column("price_change_percent", sa.Numeric()),
         sa.Column("updates", postgresql.JSONB()),
-    )
-
-    op.create_table(
+    ),
+    sa.Table(
         "macro_events",
+        _metadata,
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -79,10 +80,10 @@ def upgrade() -> None:
         sa.Column("crypto_transmission", postgresql.JSONB()),
         sa.Column("status", sa.Text(), server_default=sa.text("'new'")),
         sa.Column("thesis_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("theses.id")),
-    )
-
-    op.create_table(
+    ),
+    sa.Table(
         "metals_knowledge",
+        _metadata,
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -93,10 +94,10 @@ def upgrade() -> None:
         sa.Column("category", sa.Text(), nullable=False),
         sa.Column("content", postgresql.JSONB(), nullable=False),
         sa.Column("updated_at", sa.TIMESTAMP(timezone=True), server_default=sa.text("now()")),
-    )
-
-    op.create_table(
+    ),
+    sa.Table(
         "historical_cases",
+        _metadata,
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -115,11 +116,10 @@ def upgrade() -> None:
         sa.Column("time_delays", postgresql.ARRAY(sa.Text())),
         sa.Column("lessons", postgresql.ARRAY(sa.Text())),
         sa.Column("counter_examples", postgresql.ARRAY(sa.Text())),
-    )
-    op.execute("ALTER TABLE historical_cases ADD COLUMN embedding vector(1536)")
-
-    op.create_table(
+    ),
+    sa.Table(
         "central_bank_comms",
+        _metadata,
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -135,10 +135,10 @@ def upgrade() -> None:
         sa.Column("sentiment_score", sa.Numeric()),
         sa.Column("change_vs_previous", sa.Text()),
         sa.Column("forward_guidance", sa.Text()),
-    )
-
-    op.create_table(
+    ),
+    sa.Table(
         "economic_events",
+        _metadata,
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -155,10 +155,10 @@ def upgrade() -> None:
         sa.Column("surprise_direction", sa.Text()),
         sa.Column("surprise_magnitude", sa.Numeric()),
         sa.Column("historical_metal_impact", postgresql.JSONB()),
-    )
-
-    op.create_table(
+    ),
+    sa.Table(
         "daily_digests",
+        _metadata,
         sa.Column(
             "id",
             postgresql.UUID(as_uuid=True),
@@ -173,7 +173,29 @@ def upgrade() -> None:
         sa.Column("active_theses", postgresql.JSONB()),
         sa.Column("full_digest", sa.Text()),
         sa.UniqueConstraint("digest_date", name="uq_daily_digests_digest_date"),
-    )
+    ),
+)
+
+# Compiled once at import so repeated upgrade runs (and --sql dry runs) skip
+# SQLAlchemy's DDL compilation.
+_DIALECT = postgresql.dialect()
+CORE_SCHEMA_STATEMENTS = (
+    *(str(CreateTable(table).compile(dialect=_DIALECT)).strip() for table in _TABLES),
+    # pgvector has no SQLAlchemy type here, so the embedding column stays raw DDL.
+    "ALTER TABLE historical_cases ADD COLUMN embedding vector(1536)",
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+
+    if context.is_offline_mode():
+        for statement in CORE_SCHEMA_STATEMENTS:
+            op.execute(statement)
+    else:
+        # One round-trip for the whole schema instead of one per table.
+        op.execute(";\n".join(CORE_SCHEMA_STATEMENTS))
 
 
 def downgrade() -> None:
@@ -15,10 +15,16 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.create_unique_constraint(
-        "uq_metals_knowledge_metal_category",
-        "metals_knowledge",
-        ["metal", "category"],
+    # Build the unique index without blocking writes, then promote it to the constraint.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_metals_knowledge_metal_category "
+            "ON metals_knowledge (metal, category)"
+        )
+    op.execute(
+        "ALTER TABLE metals_knowledge "
+        "ADD CONSTRAINT uq_metals_knowledge_metal_category "
+        "UNIQUE USING INDEX uq_metals_knowledge_metal_category"
     )
 
 
@@ -15,10 +15,16 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.create_unique_constraint(
-        "uq_historical_cases_event_date",
-        "historical_cases",
-        ["event_name", "date_range"],
+    # Build the unique index without blocking writes, then promote it to the constraint.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_historical_cases_event_date "
+            "ON historical_cases (event_name, date_range)"
+        )
+    op.execute(
+        "ALTER TABLE historical_cases "
+        "ADD CONSTRAINT uq_historical_cases_event_date "
+        "UNIQUE USING INDEX uq_historical_cases_event_date"
     )
 
 
@@ -15,10 +15,16 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.create_unique_constraint(
-        "uq_macro_events_source_headline_published",
-        "macro_events",
-        ["source", "headline", "published_at"],
+    # Build the unique index without blocking writes, then promote it to the constraint.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_macro_events_source_headline_published "
+            "ON macro_events (source, headline, published_at)"
+        )
+    op.execute(
+        "ALTER TABLE macro_events "
+        "ADD CONSTRAINT uq_macro_events_source_headline_published "
+        "UNIQUE USING INDEX uq_macro_events_source_headline_published"
     )
 
 
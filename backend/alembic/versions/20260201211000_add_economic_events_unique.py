@@ -15,10 +15,16 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.create_unique_constraint(
-        "uq_economic_events_name_date_region",
-        "economic_events",
-        ["event_name", "event_date", "region"],
+    # Build the unique index without blocking writes, then promote it to the constraint.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_economic_events_name_date_region "
+            "ON economic_events (event_name, event_date, region)"
+        )
+    op.execute(
+        "ALTER TABLE economic_events "
+        "ADD CONSTRAINT uq_economic_events_name_date_region "
+        "UNIQUE USING INDEX uq_economic_events_name_date_region"
     )
 
 
@@ -0,0 +1,55 @@
+"""Add GIN jsonb_path_ops indexes on JSONB payload columns.
+
+Also merges the economic events unique constraint branch with the market data
+branch so the revision graph has a single head again.
+
+Revision ID: 20260202090000
+Revises: 20260201211000, 20260201230000
+Create Date: 2026-02-02 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202090000"
+down_revision = ("20260201211000", "20260201230000")
+branch_labels = None
+depends_on = None
+
+# jsonb_path_ops only supports containment/jsonpath operators (@>, @?, @@), which is
+# all we filter with, and produces a much smaller index than the default jsonb_ops.
+JSONB_GIN_INDEXES = (
+    ("idx_macro_events_metal_impacts_gin", "macro_events", "metal_impacts"),
+    ("idx_historical_cases_metal_impacts_gin", "historical_cases", "metal_impacts"),
+    (
+        "idx_historical_cases_time_horizon_behavior_gin",
+        "historical_cases",
+        "time_horizon_behavior",
+    ),
+    (
+        "idx_economic_events_historical_metal_impact_gin",
+        "economic_events",
+        "historical_metal_impact",
+    ),
+    ("idx_market_context_raw_prices_gin", "market_context", "raw_prices"),
+    ("idx_market_context_raw_fred_gin", "market_context", "raw_fred"),
+    ("idx_theses_updates_gin", "theses", "updates"),
+    ("idx_daily_digests_priority_events_gin", "daily_digests", "priority_events"),
+)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for index_name, table, column in JSONB_GIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index_name} "
+                f"ON {table} USING GIN ({column} jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _table, _column in reversed(JSONB_GIN_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,42 @@
+"""Store historical case embeddings as halfvec and add an HNSW index.
+
+Revision ID: 20260202093000
+Revises: 20260202090000
+Create Date: 2026-02-02 09:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202093000"
+down_revision = "20260202090000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # halfvec stores 2 bytes per dimension (vs 4 for vector), halving index size.
+    op.execute(
+        "ALTER TABLE historical_cases "
+        "ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536)"
+    )
+
+    # The operator class must match the distance operator used by queries (<-> is L2),
+    # otherwise the planner ignores the index and falls back to a sequential scan.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_historical_cases_embedding_hnsw "
+            "ON historical_cases USING hnsw (embedding halfvec_l2_ops) "
+            "WITH (m = 12, ef_construction = 24)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_historical_cases_embedding_hnsw")
+
+    op.execute(
+        "ALTER TABLE historical_cases "
+        "ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536)"
+    )
@@ -0,0 +1,35 @@
+"""Add descending covering indexes for latest-price lookups.
+
+Revision ID: 20260202100000
+Revises: 20260202093000
+Create Date: 2026-02-02 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202100000"
+down_revision = "20260202093000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Digest snapshots read the newest rows per symbol/ratio; the INCLUDE columns let
+    # those reads be served as index-only scans without heap fetches.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_daily_prices_symbol_date_desc "
+            "ON daily_prices (symbol, price_date DESC) INCLUDE (close, adj_close)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_price_ratios_name_date_desc "
+            "ON price_ratios (ratio_name, price_date DESC) INCLUDE (value)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_price_ratios_name_date_desc")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_daily_prices_symbol_date_desc")
@@ -0,0 +1,41 @@
+"""Add BRIN indexes on append-mostly time columns.
+
+Revision ID: 20260202103000
+Revises: 20260202100000
+Create Date: 2026-02-02 10:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202103000"
+down_revision = "20260202100000"
+branch_labels = None
+depends_on = None
+
+# These tables are written roughly in time order, so BRIN ranges stay tight and give
+# date-range pruning at a fraction of a btree's size. Equality lookups keep using
+# the existing unique btrees.
+BRIN_INDEXES = (
+    ("idx_macro_events_published_at_brin", "macro_events", "published_at"),
+    ("idx_economic_events_event_date_brin", "economic_events", "event_date"),
+    ("idx_central_bank_comms_published_at_brin", "central_bank_comms", "published_at"),
+    ("idx_daily_prices_price_date_brin", "daily_prices", "price_date"),
+    ("idx_market_context_context_date_brin", "market_context", "context_date"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table, column in BRIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY {index_name} "
+                f"ON {table} USING BRIN ({column}) WITH (pages_per_range = 32)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _table, _column in reversed(BRIN_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,103 @@
+"""Partition daily_prices by year on price_date.
+
+Revision ID: 20260202110000
+Revises: 20260202103000
+Create Date: 2026-02-02 11:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202110000"
+down_revision = "20260202103000"
+branch_labels = None
+depends_on = None
+
+FIRST_PARTITION_YEAR = 2000
+LAST_PARTITION_YEAR = 2030
+
+DAILY_PRICES_COLUMNS = """
+    id UUID DEFAULT gen_random_uuid() NOT NULL,
+    symbol TEXT NOT NULL,
+    price_date DATE NOT NULL,
+    open NUMERIC,
+    high NUMERIC,
+    low NUMERIC,
+    close NUMERIC,
+    adj_close NUMERIC,
+    volume BIGINT,
+    source TEXT DEFAULT 'yahoo' NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT now()
+"""
+
+DAILY_PRICES_INDEXES = (
+    (
+        "CREATE INDEX idx_daily_prices_symbol_date_desc "
+        "ON daily_prices (symbol, price_date DESC) INCLUDE (close, adj_close)"
+    ),
+    (
+        "CREATE INDEX idx_daily_prices_price_date_brin "
+        "ON daily_prices USING BRIN (price_date) WITH (pages_per_range = 32)"
+    ),
+)
+
+
+def _move_existing_table(new_name: str) -> None:
+    """Rename the current daily_prices table and its constraints out of the way."""
+    op.execute(f"ALTER TABLE daily_prices RENAME TO {new_name}")
+    op.execute(
+        f"ALTER TABLE {new_name} "
+        f"RENAME CONSTRAINT uq_daily_prices_symbol_date TO uq_{new_name}_symbol_date"
+    )
+    op.execute(f"ALTER TABLE {new_name} RENAME CONSTRAINT daily_prices_pkey TO {new_name}_pkey")
+    op.execute("DROP INDEX IF EXISTS idx_daily_prices_symbol_date_desc")
+    op.execute("DROP INDEX IF EXISTS idx_daily_prices_price_date_brin")
+
+
+def upgrade() -> None:
+    _move_existing_table("daily_prices_old")
+
+    # The partition key must be part of every unique constraint, so the primary key
+    # becomes (id, price_date); uq_daily_prices_symbol_date already includes it.
+    op.execute(
+        f"""
+        CREATE TABLE daily_prices (
+            {DAILY_PRICES_COLUMNS},
+            CONSTRAINT daily_prices_pkey PRIMARY KEY (id, price_date),
+            CONSTRAINT uq_daily_prices_symbol_date UNIQUE (symbol, price_date)
+        ) PARTITION BY RANGE (price_date)
+        """
+    )
+    for year in range(FIRST_PARTITION_YEAR, LAST_PARTITION_YEAR + 1):
+        op.execute(
+            f"CREATE TABLE daily_prices_{year} PARTITION OF daily_prices "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    # Catch-all so ingestion never fails on dates outside the pre-created years.
+    op.execute("CREATE TABLE daily_prices_default PARTITION OF daily_prices DEFAULT")
+
+    for statement in DAILY_PRICES_INDEXES:
+        op.execute(statement)
+
+    op.execute("INSERT INTO daily_prices SELECT * FROM daily_prices_old")
+    op.execute("DROP TABLE daily_prices_old")
+
+
+def downgrade() -> None:
+    _move_existing_table("daily_prices_partitioned")
+
+    op.execute(
+        f"""
+        CREATE TABLE daily_prices (
+            {DAILY_PRICES_COLUMNS},
+            CONSTRAINT daily_prices_pkey PRIMARY KEY (id),
+            CONSTRAINT uq_daily_prices_symbol_date UNIQUE (symbol, price_date)
+        )
+        """
+    )
+    for statement in DAILY_PRICES_INDEXES:
+        op.execute(statement)
+
+    op.execute("INSERT INTO daily_prices SELECT * FROM daily_prices_partitioned")
+    op.execute("DROP TABLE daily_prices_partitioned")
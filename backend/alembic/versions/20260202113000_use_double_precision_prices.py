@@ -0,0 +1,84 @@
+"""Store OHLC and market context levels as double precision.
+
+Revision ID: 20260202113000
+Revises: 20260202110000
+Create Date: 2026-02-02 11:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202113000"
+down_revision = "20260202110000"
+branch_labels = None
+depends_on = None
+
+DAILY_PRICES_COLUMNS = ("open", "high", "low", "close", "adj_close")
+
+# (column, original NUMERIC precision/scale) for the downgrade path.
+MARKET_CONTEXT_COLUMNS = (
+    ("vix_level", "10, 4"),
+    ("vix_change_1d", "10, 4"),
+    ("dxy_level", "10, 4"),
+    ("dxy_change_1d", "10, 4"),
+    ("us10y_level", "10, 4"),
+    ("us10y_change_1d", "10, 4"),
+    ("gold_level", "12, 4"),
+    ("gold_change_1d", "10, 4"),
+    ("oil_level", "10, 4"),
+    ("oil_change_1d", "10, 4"),
+    ("spx_level", "12, 4"),
+    ("spx_change_1d", "10, 4"),
+    ("btc_level", "12, 2"),
+    ("btc_change_1d", "10, 4"),
+    ("vvix_level", "10, 4"),
+    ("move_level", "10, 4"),
+    ("vix_term_structure", "10, 4"),
+    ("us2y_level", "10, 4"),
+    ("us30y_level", "10, 4"),
+    ("curve_2s10s", "10, 4"),
+    ("breakeven_5y", "10, 4"),
+    ("hy_spread", "10, 4"),
+    ("gold_silver_ratio", "10, 4"),
+    ("copper_gold_ratio", "10, 6"),
+    ("vix_vix3m_ratio", "10, 4"),
+    ("spy_rsp_ratio", "10, 4"),
+    ("hyg_lqd_ratio", "10, 4"),
+    ("suggested_size_multiplier", "5, 2"),
+)
+
+
+def _alter_columns(table: str, clauses: list[str]) -> None:
+    # A single ALTER TABLE rewrites the heap once for all columns.
+    op.execute(f"ALTER TABLE {table} " + ", ".join(clauses))
+
+
+def upgrade() -> None:
+    # float8 is fixed-width and uses hardware arithmetic; NUMERIC is variable-length
+    # and software-emulated, which slows window/aggregate queries over price history.
+    _alter_columns(
+        "daily_prices",
+        [f"ALTER COLUMN {column} TYPE DOUBLE PRECISION" for column in DAILY_PRICES_COLUMNS],
+    )
+    _alter_columns(
+        "market_context",
+        [
+            f"ALTER COLUMN {column} TYPE DOUBLE PRECISION"
+            for column, _precision in MARKET_CONTEXT_COLUMNS
+        ],
+    )
+
+
+def downgrade() -> None:
+    _alter_columns(
+        "market_context",
+        [
+            f"ALTER COLUMN {column} TYPE NUMERIC({precision})"
+            for column, precision in MARKET_CONTEXT_COLUMNS
+        ],
+    )
+    _alter_columns(
+        "daily_prices",
+        [f"ALTER COLUMN {column} TYPE NUMERIC" for column in DAILY_PRICES_COLUMNS],
+    )
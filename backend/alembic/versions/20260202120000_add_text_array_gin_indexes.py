@@ -0,0 +1,40 @@
+"""Add GIN indexes on text[] membership columns.
+
+Revision ID: 20260202120000
+Revises: 20260202113000
+Create Date: 2026-02-02 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202120000"
+down_revision = "20260202113000"
+branch_labels = None
+depends_on = None
+
+# The default array_ops opclass serves containment/overlap filters such as
+# regions @> ARRAY['china'] or transmission_channels && ARRAY['oil_supply_disruption'].
+# Note that 'x' = ANY(col) cannot use these indexes; write membership filters with @>.
+TEXT_ARRAY_GIN_INDEXES = (
+    ("idx_macro_events_regions_gin", "macro_events", "regions"),
+    ("idx_macro_events_entities_gin", "macro_events", "entities"),
+    (
+        "idx_historical_cases_transmission_channels_gin",
+        "historical_cases",
+        "transmission_channels",
+    ),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table, column in TEXT_ARRAY_GIN_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY {index_name} ON {table} USING GIN ({column})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _table, _column in reversed(TEXT_ARRAY_GIN_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,39 @@
+"""Add a partial index on macro_events.thesis_id.
+
+Revision ID: 20260202123000
+Revises: 20260202120000
+Create Date: 2026-02-02 12:30:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20260202123000"
+down_revision = "20260202120000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Backs the theses FK check on delete; most events never link to a thesis, so the
+    # partial predicate keeps the index small.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_macro_events_thesis_id",
+            "macro_events",
+            ["thesis_id"],
+            postgresql_where=sa.text("thesis_id IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_macro_events_thesis_id",
+            table_name="macro_events",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,62 @@
+"""Default hot-write primary keys to time-ordered UUIDv7.
+
+Revision ID: 20260202130000
+Revises: 20260202123000
+Create Date: 2026-02-02 13:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202130000"
+down_revision = "20260202123000"
+branch_labels = None
+depends_on = None
+
+HOT_WRITE_TABLES = (
+    "macro_events",
+    "daily_prices",
+    "price_ratios",
+    "economic_events",
+    "daily_digests",
+    "market_context",
+)
+
+# Postgres 16 has no built-in uuidv7(); this overlays the 48-bit unix millisecond
+# timestamp onto a random v4 UUID and flips the version nibble from 4 to 7.
+UUIDV7_FUNCTION = """
+    CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(
+                            int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                            FROM 3
+                        )
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex'
+        )::uuid
+    $$ LANGUAGE sql VOLATILE
+"""
+
+
+def upgrade() -> None:
+    op.execute(UUIDV7_FUNCTION)
+    # Time-ordered keys append to the rightmost btree leaf instead of dirtying a
+    # random page per insert.
+    for table in HOT_WRITE_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuidv7()")
+
+
+def downgrade() -> None:
+    for table in reversed(HOT_WRITE_TABLES):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+    op.execute("DROP FUNCTION IF EXISTS uuidv7()")
@@ -0,0 +1,45 @@
+"""Store write-only audit timestamps as second-resolution UTC TIMESTAMP.
+
+Revision ID: 20260202133000
+Revises: 20260202130000
+Create Date: 2026-02-02 13:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202133000"
+down_revision = "20260202130000"
+branch_labels = None
+depends_on = None
+
+# Only columns the application never reads back or compares against timestamptz
+# values. theses/macro_events audit columns are returned by the API and compared
+# with aware datetimes, so they stay timestamptz.
+AUDIT_COLUMNS = (
+    ("daily_prices", "created_at"),
+    ("price_ratios", "created_at"),
+    ("market_context", "created_at"),
+    ("market_context", "updated_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in AUDIT_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} TYPE TIMESTAMP(0) WITHOUT TIME ZONE "
+            f"USING {column} AT TIME ZONE 'UTC', "
+            f"ALTER COLUMN {column} SET DEFAULT timezone('utc', now())"
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(AUDIT_COLUMNS):
+        op.execute(
+            f"ALTER TABLE {table} "
+            f"ALTER COLUMN {column} TYPE TIMESTAMP WITH TIME ZONE "
+            f"USING {column} AT TIME ZONE 'UTC', "
+            f"ALTER COLUMN {column} SET DEFAULT now()"
+        )
@@ -0,0 +1,60 @@
+"""Derive market context ratio columns from raw_prices as generated columns.
+
+Revision ID: 20260202140000
+Revises: 20260202133000
+Create Date: 2026-02-02 14:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202140000"
+down_revision = "20260202133000"
+branch_labels = None
+depends_on = None
+
+# (column, numerator symbol, denominator symbol); mirrors CALCULATED_RATIOS in
+# app/data/core_watchlist.py.
+GENERATED_RATIOS = (
+    ("gold_silver_ratio", "GC=F", "SI=F"),
+    ("copper_gold_ratio", "HG=F", "GC=F"),
+    ("vix_term_structure", "^VIX", "VX=F"),
+    ("vix_vix3m_ratio", "^VIX", "^VIX3M"),
+    ("spy_rsp_ratio", "SPY", "RSP"),
+    ("hyg_lqd_ratio", "HYG", "LQD"),
+)
+
+
+def _ratio_expression(numerator: str, denominator: str) -> str:
+    return (
+        f"(raw_prices->>'{numerator}')::double precision "
+        f"/ NULLIF((raw_prices->>'{denominator}')::double precision, 0)"
+    )
+
+
+def upgrade() -> None:
+    # Existing columns cannot be converted in place, so drop and re-add them; the
+    # stored expressions backfill every row from raw_prices during the rewrite.
+    op.execute(
+        "ALTER TABLE market_context "
+        + ", ".join(f"DROP COLUMN {column}" for column, _num, _den in GENERATED_RATIOS)
+    )
+    op.execute(
+        "ALTER TABLE market_context "
+        + ", ".join(
+            f"ADD COLUMN {column} DOUBLE PRECISION "
+            f"GENERATED ALWAYS AS ({_ratio_expression(numerator, denominator)}) STORED"
+            for column, numerator, denominator in GENERATED_RATIOS
+        )
+    )
+
+
+def downgrade() -> None:
+    # DROP EXPRESSION keeps the computed values as plain column data.
+    op.execute(
+        "ALTER TABLE market_context "
+        + ", ".join(
+            f"ALTER COLUMN {column} DROP EXPRESSION" for column, _num, _den in GENERATED_RATIOS
+        )
+    )
@@ -0,0 +1,53 @@
+"""Deduplicate macro events on a headline hash instead of the full headline.
+
+Revision ID: 20260202143000
+Revises: 20260202140000
+Create Date: 2026-02-02 14:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202143000"
+down_revision = "20260202140000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A 32-byte sha256 keeps index tuples small and avoids the btree row-size limit
+    # that very long headlines can hit. digest() comes from pgcrypto.
+    op.execute(
+        "ALTER TABLE macro_events ADD COLUMN headline_sha BYTEA "
+        "GENERATED ALWAYS AS (digest(headline, 'sha256')) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY uq_macro_events_source_headline_sha_published "
+            "ON macro_events (source, headline_sha, published_at)"
+        )
+    op.execute(
+        "ALTER TABLE macro_events "
+        "ADD CONSTRAINT uq_macro_events_source_headline_sha_published "
+        "UNIQUE USING INDEX uq_macro_events_source_headline_sha_published"
+    )
+    op.drop_constraint(
+        "uq_macro_events_source_headline_published",
+        "macro_events",
+        type_="unique",
+    )
+
+
+def downgrade() -> None:
+    op.create_unique_constraint(
+        "uq_macro_events_source_headline_published",
+        "macro_events",
+        ["source", "headline", "published_at"],
+    )
+    op.drop_constraint(
+        "uq_macro_events_source_headline_sha_published",
+        "macro_events",
+        type_="unique",
+    )
+    op.drop_column("macro_events", "headline_sha")
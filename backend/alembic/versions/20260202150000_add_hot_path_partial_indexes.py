@@ -0,0 +1,48 @@
+"""Add partial indexes for the new/priority event and active thesis listings.
+
+Revision ID: 20260202150000
+Revises: 20260202143000
+Create Date: 2026-02-02 15:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202150000"
+down_revision = "20260202143000"
+branch_labels = None
+depends_on = None
+
+# Key order and NULLS placement mirror the ORDER BY of the listing queries in
+# app/api/events.py, app/analysis/macro_event_analysis.py and app/services/digests.py
+# so they can read rows in index order and stop at LIMIT.
+PARTIAL_INDEXES = (
+    (
+        "idx_macro_events_new",
+        "macro_events (published_at DESC NULLS LAST, created_at DESC)",
+        "status = 'new'",
+    ),
+    (
+        "idx_macro_events_priority",
+        "macro_events (published_at DESC NULLS LAST, created_at DESC)",
+        "priority_flag",
+    ),
+    (
+        "idx_theses_active",
+        "theses (updated_at DESC NULLS LAST, created_at DESC, id DESC)",
+        "status IS NULL OR status NOT IN ('closed', 'dismissed', 'archived')",
+    ),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, target, predicate in PARTIAL_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY {index_name} ON {target} WHERE {predicate}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _target, _predicate in reversed(PARTIAL_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
@@ -0,0 +1,55 @@
+"""Move market_context.raw_fred into an UNLOGGED sibling table.
+
+Revision ID: 20260202153000
+Revises: 20260202150000
+Create Date: 2026-02-02 15:30:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision = "20260202153000"
+down_revision = "20260202150000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # raw_fred is a debugging copy of values already parsed into typed columns and
+    # can be re-fetched from FRED, so it does not need WAL. raw_prices stays on
+    # market_context because the generated ratio columns are computed from it.
+    op.execute(
+        """
+        CREATE UNLOGGED TABLE market_context_raw (
+            context_date DATE PRIMARY KEY
+                REFERENCES market_context (context_date) ON DELETE CASCADE,
+            raw_fred JSONB
+        )
+        """
+    )
+    op.execute(
+        "INSERT INTO market_context_raw (context_date, raw_fred) "
+        "SELECT context_date, raw_fred FROM market_context WHERE raw_fred IS NOT NULL"
+    )
+    op.drop_column("market_context", "raw_fred")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "market_context",
+        sa.Column(
+            "raw_fred",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+            comment="All fetched FRED series keyed by series ID",
+        ),
+    )
+    op.execute(
+        "UPDATE market_context AS mc SET raw_fred = raw.raw_fred "
+        "FROM market_context_raw AS raw WHERE raw.context_date = mc.context_date"
+    )
+    op.drop_table("market_context_raw")
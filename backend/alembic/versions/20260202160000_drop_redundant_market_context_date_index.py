@@ -0,0 +1,34 @@
+"""Drop idx_market_context_date, which duplicates the context_date unique index.
+
+Revision ID: 20260202160000
+Revises: 20260202153000
+Create Date: 2026-02-02 16:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202160000"
+down_revision = "20260202153000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # market_context_context_date_key already indexes context_date, and btrees scan
+    # backwards for the ORDER BY context_date DESC LIMIT 1 lookup.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_market_context_date")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_market_context_date",
+            "market_context",
+            ["context_date"],
+            unique=False,
+            postgresql_using="btree",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,32 @@
+"""Cluster price history tables in (symbol/ratio, date) order.
+
+Revision ID: 20260202163000
+Revises: 20260202160000
+Create Date: 2026-02-02 16:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202163000"
+down_revision = "20260202160000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rewrites the heap so a symbol's history is read sequentially instead of as
+    # scattered page fetches. CLUSTER on a partitioned table cannot run inside a
+    # transaction block.
+    with op.get_context().autocommit_block():
+        op.execute("CLUSTER daily_prices USING uq_daily_prices_symbol_date")
+        op.execute("CLUSTER price_ratios USING uq_price_ratios_name_date")
+
+    # Remember the clustering index so a bare CLUSTER re-applies the order. Postgres
+    # does not support marking a clustering index on a partitioned parent.
+    op.execute("ALTER TABLE price_ratios CLUSTER ON uq_price_ratios_name_date")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE price_ratios SET WITHOUT CLUSTER")
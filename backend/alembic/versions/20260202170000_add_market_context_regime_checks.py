@@ -0,0 +1,43 @@
+"""Constrain market_context regime columns to their known labels.
+
+Revision ID: 20260202170000
+Revises: 20260202163000
+Create Date: 2026-02-02 17:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202170000"
+down_revision = "20260202163000"
+branch_labels = None
+depends_on = None
+
+# Labels produced by the classify_*_regime functions in app/analysis/market_context.py,
+# including the "unknown" fallback used when the input level is missing.
+REGIME_VALUES = {
+    "volatility_regime": ("calm", "normal", "elevated", "fear", "crisis", "unknown"),
+    "dollar_regime": ("weak", "neutral", "strong", "unknown"),
+    "curve_regime": ("steep", "normal", "flat", "inverted", "unknown"),
+    "credit_regime": ("tight", "normal", "wide", "stressed", "crisis", "unknown"),
+}
+
+
+def upgrade() -> None:
+    # NOT VALID skips the full-table check while the exclusive lock is held.
+    for column, values in REGIME_VALUES.items():
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.execute(
+            f"ALTER TABLE market_context ADD CONSTRAINT ck_market_context_{column} "
+            f"CHECK ({column} IN ({allowed})) NOT VALID"
+        )
+    # Validate after the ADDs commit; VALIDATE only takes a SHARE UPDATE EXCLUSIVE lock.
+    with op.get_context().autocommit_block():
+        for column in REGIME_VALUES:
+            op.execute(f"ALTER TABLE market_context VALIDATE CONSTRAINT ck_market_context_{column}")
+
+
+def downgrade() -> None:
+    for column in reversed(REGIME_VALUES):
+        op.drop_constraint(f"ck_market_context_{column}", "market_context", type_="check")
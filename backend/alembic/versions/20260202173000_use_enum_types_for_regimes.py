@@ -0,0 +1,64 @@
+"""Store market_context regime columns as native enum types.
+
+Revision ID: 20260202173000
+Revises: 20260202170000
+Create Date: 2026-02-02 17:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202173000"
+down_revision = "20260202170000"
+branch_labels = None
+depends_on = None
+
+# Declared in ascending severity so ORDER BY on a regime column sorts meaningfully.
+REGIME_ENUMS = {
+    "volatility_regime": ("calm", "normal", "elevated", "fear", "crisis", "unknown"),
+    "dollar_regime": ("weak", "neutral", "strong", "unknown"),
+    "curve_regime": ("steep", "normal", "flat", "inverted", "unknown"),
+    "credit_regime": ("tight", "normal", "wide", "stressed", "crisis", "unknown"),
+}
+
+# Column comments from 20260201220000, restored on downgrade.
+REGIME_COMMENTS = {
+    "volatility_regime": "calm, normal, elevated, fear, crisis",
+    "dollar_regime": "weak, neutral, strong",
+    "curve_regime": "inverted, flat, normal, steep",
+    "credit_regime": "tight, normal, wide, stressed, crisis",
+}
+
+
+def _labels(values: tuple[str, ...]) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    # Enum values are stored as a 4-byte OID instead of repeating the label text in
+    # every row; the type itself now documents and enforces the allowed labels, so
+    # the CHECK constraints and column comments are dropped.
+    clauses: list[str] = []
+    for column, values in REGIME_ENUMS.items():
+        op.execute(f"CREATE TYPE {column}_t AS ENUM ({_labels(values)})")
+        clauses.append(f"DROP CONSTRAINT ck_market_context_{column}")
+        clauses.append(f"ALTER COLUMN {column} TYPE {column}_t USING {column}::{column}_t")
+    op.execute("ALTER TABLE market_context " + ", ".join(clauses))
+
+    for column in REGIME_ENUMS:
+        op.execute(f"COMMENT ON COLUMN market_context.{column} IS NULL")
+
+
+def downgrade() -> None:
+    clauses: list[str] = []
+    for column, values in REGIME_ENUMS.items():
+        clauses.append(f"ALTER COLUMN {column} TYPE TEXT USING {column}::text")
+        clauses.append(
+            f"ADD CONSTRAINT ck_market_context_{column} CHECK ({column} IN ({_labels(values)}))"
+        )
+    op.execute("ALTER TABLE market_context " + ", ".join(clauses))
+
+    for column, comment in REGIME_COMMENTS.items():
+        op.execute(f"COMMENT ON COLUMN market_context.{column} IS '{comment}'")
+        op.execute(f"DROP TYPE {column}_t")
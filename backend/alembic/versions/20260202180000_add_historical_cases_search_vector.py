@@ -0,0 +1,48 @@
+"""Add a stored full-text search vector to historical_cases.
+
+Revision ID: 20260202180000
+Revises: 20260202173000
+Create Date: 2026-02-02 18:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202180000"
+down_revision = "20260202173000"
+branch_labels = None
+depends_on = None
+
+# array_to_string() is only STABLE (it goes through the element type's output
+# function), so generated columns cannot call it directly. For text[] the result
+# never changes, which makes an IMMUTABLE wrapper safe.
+TEXT_ARRAY_TO_STRING_FUNCTION = """
+    CREATE OR REPLACE FUNCTION text_array_to_string(text[]) RETURNS text AS $$
+        SELECT array_to_string($1, ' ')
+    $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE
+"""
+
+# The same fields the in-process keyword ranking used to concatenate per case.
+SEARCH_VECTOR_FIELDS = (
+    "event_name",
+    "event_type",
+    "text_array_to_string(structural_drivers)",
+    "text_array_to_string(lessons)",
+    "text_array_to_string(counter_examples)",
+    "text_array_to_string(traditional_market_reaction)",
+)
+
+
+def upgrade() -> None:
+    op.execute(TEXT_ARRAY_TO_STRING_FUNCTION)
+    document = " || ' ' || ".join(f"coalesce({field}, '')" for field in SEARCH_VECTOR_FIELDS)
+    op.execute(
+        "ALTER TABLE historical_cases ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('english', {document})) STORED"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("historical_cases", "search_vector")
+    op.execute("DROP FUNCTION IF EXISTS text_array_to_string(text[])")
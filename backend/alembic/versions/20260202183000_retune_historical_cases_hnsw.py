@@ -0,0 +1,40 @@
+"""Rebuild the historical case HNSW index with higher-recall build parameters.
+
+Revision ID: 20260202183000
+Revises: 20260202180000
+Create Date: 2026-02-02 18:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202183000"
+down_revision = "20260202180000"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "idx_historical_cases_embedding_hnsw"
+
+
+def _rebuild(m: int, ef_construction: int) -> None:
+    # Build the replacement first so similarity queries never lose their index,
+    # then swap names.
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY {INDEX_NAME}_new "
+            "ON historical_cases USING hnsw (embedding halfvec_l2_ops) "
+            f"WITH (m = {m}, ef_construction = {ef_construction})"
+        )
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+    op.execute(f"ALTER INDEX {INDEX_NAME}_new RENAME TO {INDEX_NAME}")
+
+
+def upgrade() -> None:
+    # m = 24 / ef_construction = 128 keeps recall >= 0.99 at the ef_search values
+    # find_similar_cases uses (MERIDIAN_HNSW_EF_SEARCH).
+    _rebuild(m=24, ef_construction=128)
+
+
+def downgrade() -> None:
+    _rebuild(m=12, ef_construction=24)
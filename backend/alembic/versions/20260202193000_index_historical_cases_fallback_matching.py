@@ -0,0 +1,41 @@
+"""Index the historical case full-text and event-type fallback predicates.
+
+Revision ID: 20260202193000
+Revises: 20260202183000
+Create Date: 2026-02-02 19:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20260202193000"
+down_revision = "20260202183000"
+branch_labels = None
+depends_on = None
+
+# fallback_matches filters on `search_vector @@ query OR <normalized type> = ANY(...)`;
+# with both sides indexed the planner can BitmapOr them instead of scanning the table.
+# The type expression must match _CASE_TYPE_SQL in app/analysis/historical.py.
+INDEXES = (
+    (
+        "idx_historical_cases_search_vector",
+        "historical_cases USING gin (search_vector)",
+    ),
+    (
+        "idx_historical_cases_event_type_normalized",
+        "historical_cases ((replace(replace(lower(trim(event_type)), '-', '_'), ' ', '_')))",
+    ),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, target in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY {index_name} ON {target}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, _target in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
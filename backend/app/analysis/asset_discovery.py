@@ -29,11 +29,12 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from app.analysis.transmission_channels import (
-    ALL_CHANNELS,
     TransmissionChannel,
+    get_channel_by_type,
     get_channels_for_event_type,
     match_channels_by_keywords,
 )
@@ -41,12 +42,14 @@ from app.analysis.transmission_channels import (
 logger = logging.getLogger(__name__)
 
 
-# Common ticker patterns for extraction from text
-TICKER_PATTERN = re.compile(
-    r"\b([A-Z]{1,5}(?:=[A-Z])?)\b"  # Match tickers like AAPL, CL=F, GC=F
-)
+# Common ticker patterns for extraction from text: 1-5 uppercase letters with an
+# optional one-letter suffix. Only futures/forex symbols (CL=F, EURUSD=X) and
+# plain 2-5 letter words (AAPL) are captured, in groups 1 and 2; other suffixes
+# and single letters still match, so they are consumed rather than re-scanned.
+TICKER_PATTERN = re.compile(r"\b(?:([A-Z]{1,5}=[FX])|[A-Z]{1,5}=[A-Z]|([A-Z]{2,5})|[A-Z])\b")
 
-# Known non-tickers that match the pattern
+# Known non-tickers that match the pattern. Kept as one frozenset: membership is a
+# single hash probe whatever the size, so splitting it by length only adds work.
 NON_TICKERS = frozenset(
     {
         "A",
@@ -149,11 +152,13 @@ NON_TICKERS = frozenset(
     }
 )
 
-# Valid ticker suffixes for futures/forex
-VALID_SUFFIXES = frozenset({"=F", "=X"})
+# Every format validate_tickers accepts, as one alternation: plain tickers (AAPL),
+# share classes (BRK.B) and futures/forex symbols (GC=F, EURUSD=X). Like
+# TICKER_PATTERN, only the =F (futures) and =X (forex) suffixes are valid.
+_TICKER_VALID_RE = re.compile(r"^(?:[A-Z]{1,5}|[A-Z]{1,4}\.[A-Z]|[A-Z]{1,6}=[FX])$")
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveryResult:
     """Result of asset discovery for an event."""
 
@@ -166,13 +171,9 @@ class DiscoveryResult:
 
     def all_assets(self) -> list[str]:
         """Return all assets in priority order (primary, secondary, discovered)."""
-        seen: set[str] = set()
-        result: list[str] = []
-        for asset in self.primary_assets + self.secondary_assets + self.discovered_assets:
-            if asset not in seen:
-                seen.add(asset)
-                result.append(asset)
-        return result
+        return list(
+            dict.fromkeys(self.primary_assets + self.secondary_assets + self.discovered_assets)
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -204,6 +205,9 @@ def discover_assets_for_event(
     3. Extract assets from matched channels
     4. Deduplicate and prioritize
 
+    The keyword scan is memoized on the search text; each call still returns a
+    fresh DiscoveryResult, so callers may mutate it freely.
+
     Args:
         headline: Event headline
         event_type: Normalized event type (from significance.py)
@@ -214,55 +218,63 @@ def discover_assets_for_event(
     Returns:
         DiscoveryResult with matched channels and assets
     """
-    result = DiscoveryResult()
+    search_text = headline if full_text is None else f"{headline} {full_text}"
+    channels = _match_channels(search_text, event_type, max_channels)
+    return _expand_channels(channels, include_secondary)
+
 
-    # Step 1: Match channels by keywords
-    search_text = f"{headline} {full_text or ''}"
-    keyword_matched = match_channels_by_keywords(search_text)
+# Keyed on the full search text, so keep the cache modest.
+@lru_cache(maxsize=1024)
+def _keyword_channels(search_text: str) -> tuple[TransmissionChannel, ...]:
+    """Memoized keyword scan; shared by every event type matched against the same text."""
+    return tuple(match_channels_by_keywords(search_text))
 
-    # Step 2: Match channels by event type
+
+def _match_channels(
+    search_text: str,
+    event_type: str | None,
+    max_channels: int,
+) -> list[TransmissionChannel]:
+    """Match channels by keywords first, then by event type, one channel per type."""
     type_matched: list[TransmissionChannel] = []
     if event_type:
         type_matched = get_channels_for_event_type(event_type)
 
-    # Step 3: Combine and deduplicate channels
     seen_types: set[str] = set()
     combined: list[TransmissionChannel] = []
 
-    # Keyword matches first (more specific)
-    for channel in keyword_matched:
-        if channel.channel_type.value not in seen_types:
-            seen_types.add(channel.channel_type.value)
-            combined.append(channel)
-
-    # Then type matches
-    for channel in type_matched:
-        if channel.channel_type.value not in seen_types:
-            seen_types.add(channel.channel_type.value)
+    # Keyword matches first (more specific), then type matches
+    for channel in (*_keyword_channels(search_text), *type_matched):
+        ctype = channel.channel_type.value
+        if ctype not in seen_types:
+            seen_types.add(ctype)
             combined.append(channel)
 
-    # Limit to max_channels
-    result.channels = combined[:max_channels]
-
-    # Step 4: Extract assets from channels
-    primary_seen: set[str] = set()
-    secondary_seen: set[str] = set()
+    return combined[:max_channels]
 
-    for channel in result.channels:
-        for asset in channel.primary_assets:
-            if asset not in primary_seen:
-                primary_seen.add(asset)
-                result.primary_assets.append(asset)
 
-        if include_secondary:
-            for asset in channel.secondary_assets:
-                if asset not in secondary_seen and asset not in primary_seen:
-                    secondary_seen.add(asset)
-                    result.secondary_assets.append(asset)
-
-    # Step 5: Collect search queries for potential web search
-    for channel in result.channels:
-        result.search_queries_used.extend(channel.search_queries)
+def _expand_channels(
+    channels: list[TransmissionChannel],
+    include_secondary: bool,
+) -> DiscoveryResult:
+    """Build a fresh DiscoveryResult from matched channels."""
+    result = DiscoveryResult(channels=list(channels))
+
+    # Secondaries never repeat a primary
+    result.primary_assets = list(dict.fromkeys(a for ch in channels for a in ch.primary_assets))
+    if include_secondary:
+        primary_set = set(result.primary_assets)
+        result.secondary_assets = [
+            a
+            for a in dict.fromkeys(a for ch in channels for a in ch.secondary_assets)
+            if a not in primary_set
+        ]
+
+    # Search queries for potential web search; channels often share queries, and
+    # each repeat would cost another search downstream
+    result.search_queries_used = list(
+        dict.fromkeys(q for ch in channels for q in ch.search_queries)
+    )
 
     return result
 
@@ -283,17 +295,16 @@ def discover_assets_by_channel_type(
     """
     result = DiscoveryResult()
 
-    for channel in ALL_CHANNELS:
-        if channel.channel_type.value == channel_type:
-            result.channels = [channel]
-            result.primary_assets = list(channel.primary_assets)
-            if include_secondary:
-                result.secondary_assets = list(channel.secondary_assets)
-            result.search_queries_used = list(channel.search_queries)
-            break
-
-    if not result.channels:
+    channel = get_channel_by_type(channel_type)
+    if channel is None:
         result.errors.append(f"Unknown channel type: {channel_type}")
+        return result
+
+    result.channels = [channel]
+    result.primary_assets = list(channel.primary_assets)
+    if include_secondary:
+        result.secondary_assets = list(channel.secondary_assets)
+    result.search_queries_used = list(channel.search_queries)
 
     return result
 
@@ -310,28 +321,17 @@ def extract_tickers_from_text(text: str) -> list[str]:
     Returns:
         List of potential ticker symbols
     """
-    matches = TICKER_PATTERN.findall(text)
     tickers: list[str] = []
     seen: set[str] = set()
 
-    for match in matches:
-        upper = match.upper()
-        if upper in NON_TICKERS:
-            continue
-        if upper in seen:
-            continue
-
-        # Keep if it's a known pattern (futures, forex)
-        if "=" in upper:
-            if any(upper.endswith(suffix) for suffix in VALID_SUFFIXES):
-                seen.add(upper)
-                tickers.append(upper)
+    # The pattern already enforces length and suffix rules; only the
+    # non-ticker words and repeats are filtered here.
+    for match in TICKER_PATTERN.finditer(text):
+        upper = match[1] or match[2]
+        if upper is None or upper in NON_TICKERS or upper in seen:
             continue
-
-        # Keep if it's 2-5 uppercase letters (likely ticker)
-        if 2 <= len(upper) <= 5:
-            seen.add(upper)
-            tickers.append(upper)
+        seen.add(upper)
+        tickers.append(upper)
 
     return tickers
 
@@ -352,29 +352,9 @@ def validate_tickers(tickers: list[str]) -> list[str]:
     valid: list[str] = []
 
     for ticker in tickers:
-        # Basic format checks
-        if not ticker:
-            continue
-
-        # Skip if in non-ticker list
-        if ticker.upper() in NON_TICKERS:
-            continue
-
-        # Accept futures and forex
-        if "=" in ticker:
-            if any(ticker.upper().endswith(s) for s in VALID_SUFFIXES):
-                valid.append(ticker)
-            continue
-
-        # Accept 1-5 letter tickers
-        if re.match(r"^[A-Z]{1,5}$", ticker.upper()):
-            valid.append(ticker.upper())
-            continue
-
-        # Accept tickers with dots (BRK.A, BRK.B)
-        if re.match(r"^[A-Z]{1,4}\.[A-Z]$", ticker.upper()):
-            valid.append(ticker.upper())
-            continue
+        upper = ticker.upper()
+        if upper and upper not in NON_TICKERS and _TICKER_VALID_RE.match(upper):
+            valid.append(upper)
 
     return valid
 
@@ -391,42 +371,29 @@ def merge_discovery_results(*results: DiscoveryResult) -> DiscoveryResult:
     """
     merged = DiscoveryResult()
     channel_seen: set[str] = set()
-    primary_seen: set[str] = set()
-    secondary_seen: set[str] = set()
-    discovered_seen: set[str] = set()
-    query_seen: set[str] = set()
 
     for result in results:
         for channel in result.channels:
-            if channel.channel_type.value not in channel_seen:
-                channel_seen.add(channel.channel_type.value)
+            ctype = channel.channel_type.value
+            if ctype not in channel_seen:
+                channel_seen.add(ctype)
                 merged.channels.append(channel)
 
-        for asset in result.primary_assets:
-            if asset not in primary_seen:
-                primary_seen.add(asset)
-                merged.primary_assets.append(asset)
-
-        for asset in result.secondary_assets:
-            if asset not in secondary_seen and asset not in primary_seen:
-                secondary_seen.add(asset)
-                merged.secondary_assets.append(asset)
-
-        for asset in result.discovered_assets:
-            if (
-                asset not in discovered_seen
-                and asset not in primary_seen
-                and asset not in secondary_seen
-            ):
-                discovered_seen.add(asset)
-                merged.discovered_assets.append(asset)
-
-        for query in result.search_queries_used:
-            if query not in query_seen:
-                query_seen.add(query)
-                merged.search_queries_used.append(query)
-
-        merged.errors.extend(result.errors)
+    # dict.fromkeys keeps first-seen order; an asset only lands in the highest
+    # priority bucket any result placed it in.
+    merged.primary_assets = list(dict.fromkeys(a for r in results for a in r.primary_assets))
+    taken = set(merged.primary_assets)
+    merged.secondary_assets = [
+        a for a in dict.fromkeys(a for r in results for a in r.secondary_assets) if a not in taken
+    ]
+    taken.update(merged.secondary_assets)
+    merged.discovered_assets = [
+        a for a in dict.fromkeys(a for r in results for a in r.discovered_assets) if a not in taken
+    ]
+    merged.search_queries_used = list(
+        dict.fromkeys(q for r in results for q in r.search_queries_used)
+    )
+    merged.errors = [e for r in results for e in r.errors]
 
     return merged
 
@@ -444,28 +411,17 @@ def format_discovery_for_prompt(result: DiscoveryResult) -> str:
     lines = ["=== DISCOVERED ASSETS ==="]
 
     if result.channels:
-        lines.append("")
-        lines.append("TRANSMISSION CHANNELS:")
-        for channel in result.channels:
-            lines.append(f"  • {channel.name}")
-            lines.append(f"    {channel.description[:100]}...")
-
-    if result.primary_assets:
-        lines.append("")
-        lines.append("PRIMARY ASSETS (high relevance):")
-        lines.append(f"  {', '.join(result.primary_assets[:10])}")
-
-    if result.secondary_assets:
-        lines.append("")
-        lines.append("SECONDARY ASSETS (related exposure):")
-        lines.append(f"  {', '.join(result.secondary_assets[:10])}")
-
-    if result.discovered_assets:
-        lines.append("")
-        lines.append("ADDITIONAL DISCOVERED:")
-        lines.append(f"  {', '.join(result.discovered_assets[:10])}")
-
-    lines.append("")
-    lines.append("=" * 25)
+        lines += ["", "TRANSMISSION CHANNELS:"]
+        lines.extend(f"  • {c.name}\n    {c.description[:100]}..." for c in result.channels)
+
+    for heading, assets in (
+        ("PRIMARY ASSETS (high relevance):", result.primary_assets),
+        ("SECONDARY ASSETS (related exposure):", result.secondary_assets),
+        ("ADDITIONAL DISCOVERED:", result.discovered_assets),
+    ):
+        if assets:
+            lines += ["", heading, f"  {', '.join(assets[:10])}"]
+
+    lines += ["", "=" * 25]
 
     return "\n".join(lines)
@@ -31,6 +31,7 @@ Usage:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -63,7 +64,7 @@ class CounterCaseStrength(Enum):
     NONE = "none"  # No significant counter-case
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConvictionComponent:
     """A single component of the conviction score."""
 
@@ -72,11 +73,14 @@ class ConvictionComponent:
     max_score: float
     weight: float = 1.0
     rationale: str = ""
+    # Weighted contribution to total score; the component is frozen, so it is
+    # computed once at construction and cannot go stale.
+    weighted_score: float = field(init=False)
 
-    @property
-    def weighted_score(self) -> float:
-        """Return the weighted contribution to total score."""
-        return min(self.raw_score * self.weight, self.max_score)
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "weighted_score", min(self.raw_score * self.weight, self.max_score)
+        )
 
     @property
     def percentage(self) -> float:
@@ -86,7 +90,7 @@ class ConvictionComponent:
         return (self.raw_score / self.max_score) * 100
 
 
-@dataclass
+@dataclass(slots=True)
 class ConvictionResult:
     """Result of conviction score calculation."""
 
@@ -123,6 +127,13 @@ COMPONENT_CONFIG = {
     "counter_case_discount": {"max_score": 15, "weight": -1.0},  # Negative weight
 }
 
+# Per-component caps, resolved once at import
+_MAX_HISTORICAL = COMPONENT_CONFIG["historical_precedent"]["max_score"]
+_MAX_QUANTITATIVE = COMPONENT_CONFIG["quantitative_magnitude"]["max_score"]
+_MAX_CHANNEL = COMPONENT_CONFIG["channel_clarity"]["max_score"]
+_MAX_TIMING = COMPONENT_CONFIG["timing_catalyst"]["max_score"]
+_MAX_COUNTER_CASE = COMPONENT_CONFIG["counter_case_discount"]["max_score"]
+
 # Thresholds for conviction levels
 CONVICTION_THRESHOLDS = {
     ConvictionLevel.HIGH: 70,
@@ -131,6 +142,56 @@ CONVICTION_THRESHOLDS = {
     ConvictionLevel.INSUFFICIENT: 0,
 }
 
+# CONVICTION_THRESHOLDS as (threshold, level) pairs in ascending order, split into
+# parallel tuples for bisect. The lowest level is the floor, so only the cutoffs
+# above it are bisected. No enum hashing happens per classification.
+_LEVEL_TABLE = tuple(
+    sorted(
+        ((threshold, level) for level, threshold in CONVICTION_THRESHOLDS.items()),
+        key=lambda pair: pair[0],
+    )
+)
+_LEVEL_CUTOFFS = tuple(threshold for threshold, _ in _LEVEL_TABLE[1:])
+_LEVELS = tuple(level for _, level in _LEVEL_TABLE)
+
+# Score ladders: (ascending cutoffs, (points, rationale suffix) per band). A positive
+# value below the first cutoff lands in the first band; values <= 0 score nothing.
+# A None suffix means the band adds no rationale line.
+_COUNT_LADDER = ((2, 3), ((10, None), (15, None), (20, None)))
+_PRODUCTION_DROP_LADDER = (
+    (20, 50, 90),
+    ((2, " (minor)"), (4, " (moderate)"), (7, " (major)"), (10, " (severe)")),
+)
+_PRICE_IMPACT_LADDER = (
+    (20, 50, 100),
+    ((2, " (minor)"), (4, " (notable)"), (7, " (major)"), (10, " (extreme)")),
+)
+_GLOBAL_SUPPLY_LADDER = ((2, 5), ((1, None), (3, ""), (5, " (significant)")))
+
+# (raw_score, rationale) per lowercased label; unknown labels score as "none"
+_TIMING_TABLE: dict[str, tuple[int, str]] = {
+    "high": (15, "Clear catalyst with specific timing"),
+    "medium": (10, "General timeframe identified"),
+    "low": (5, "Vague or uncertain timing"),
+    "none": (0, "No clear catalyst or timing"),
+}
+_COUNTER_CASE_TABLE: dict[str, tuple[int, str]] = {
+    "strong": (15, "Strong counter-arguments present"),  # Will be negated by weight
+    "moderate": (10, "Some valid concerns identified"),
+    "weak": (5, "Minor concerns only"),
+    "none": (0, "No significant counter-case"),
+}
+
+
+def _ladder_score(
+    value: float, ladder: tuple[tuple[float, ...], tuple[tuple[int, str | None], ...]]
+) -> tuple[int, str | None]:
+    """Return the (points, suffix) band for ``value``, or (0, None) if not positive."""
+    if value <= 0:
+        return 0, None
+    cutoffs, bands = ladder
+    return bands[bisect_right(cutoffs, value)]
+
 
 def calculate_conviction_score(
     historical_cases: list[dict[str, Any]] | None = None,
@@ -205,41 +266,35 @@ def _score_historical_precedent(cases: list[dict[str, Any]]) -> ConvictionCompon
     - 3+ cases: 20 points
     - Bonus: +5 if average significance_score > 80
     """
-    config = COMPONENT_CONFIG["historical_precedent"]
-    max_score = config["max_score"]
-
     if not cases:
         return ConvictionComponent(
             name="Historical Precedent",
             raw_score=0,
-            max_score=max_score,
+            max_score=_MAX_HISTORICAL,
             rationale="No historical cases matched",
         )
 
     # Base score from number of cases
     case_count = len(cases)
-    if case_count == 1:
-        base_score = 10
-    elif case_count == 2:
-        base_score = 15
-    else:
-        base_score = 20
+    base_score, _ = _ladder_score(case_count, _COUNT_LADDER)
 
     # Bonus for high-significance cases
-    significance_scores = [
-        c.get("significance_score", 0) for c in cases if c.get("significance_score")
-    ]
-    avg_significance = (
-        sum(significance_scores) / len(significance_scores) if significance_scores else 0
-    )
+    total_significance = 0
+    scored_cases = 0
+    for case in cases:
+        significance = case.get("significance_score")
+        if significance:
+            total_significance += significance
+            scored_cases += 1
+    avg_significance = total_significance / scored_cases if scored_cases else 0
     bonus = 5 if avg_significance > 80 else 0
 
-    raw_score = min(base_score + bonus, max_score)
+    raw_score = min(base_score + bonus, _MAX_HISTORICAL)
 
     return ConvictionComponent(
         name="Historical Precedent",
         raw_score=raw_score,
-        max_score=max_score,
+        max_score=_MAX_HISTORICAL,
         rationale=f"{case_count} case(s) matched, avg significance {avg_significance:.0f}",
     )
 
@@ -253,14 +308,11 @@ def _score_quantitative_magnitude(impacts: dict[str, Any]) -> ConvictionComponen
     - price_impact_pct: Higher = more significant
     - global_supply_impact_pct: Market-wide significance
     """
-    config = COMPONENT_CONFIG["quantitative_magnitude"]
-    max_score = config["max_score"]
-
     if not impacts:
         return ConvictionComponent(
             name="Quantitative Magnitude",
             raw_score=0,
-            max_score=max_score,
+            max_score=_MAX_QUANTITATIVE,
             rationale="No quantitative impact data available",
         )
 
@@ -269,52 +321,32 @@ def _score_quantitative_magnitude(impacts: dict[str, Any]) -> ConvictionComponen
 
     # Production drop scoring (0-10 points)
     prod_drop = impacts.get("production_drop_pct", 0)
-    if prod_drop >= 90:
-        score += 10
-        rationale_parts.append(f"production drop {prod_drop}% (severe)")
-    elif prod_drop >= 50:
-        score += 7
-        rationale_parts.append(f"production drop {prod_drop}% (major)")
-    elif prod_drop >= 20:
-        score += 4
-        rationale_parts.append(f"production drop {prod_drop}% (moderate)")
-    elif prod_drop > 0:
-        score += 2
-        rationale_parts.append(f"production drop {prod_drop}% (minor)")
+    points, suffix = _ladder_score(prod_drop, _PRODUCTION_DROP_LADDER)
+    score += points
+    if suffix is not None:
+        rationale_parts.append(f"production drop {prod_drop}%{suffix}")
 
     # Price impact scoring (0-10 points)
     price_impact = impacts.get("price_impact_pct", impacts.get("peak_price_impact_pct", 0))
-    if price_impact >= 100:
-        score += 10
-        rationale_parts.append(f"price impact {price_impact}% (extreme)")
-    elif price_impact >= 50:
-        score += 7
-        rationale_parts.append(f"price impact {price_impact}% (major)")
-    elif price_impact >= 20:
-        score += 4
-        rationale_parts.append(f"price impact {price_impact}% (notable)")
-    elif price_impact > 0:
-        score += 2
-        rationale_parts.append(f"price impact {price_impact}% (minor)")
-
-    # Global supply impact bonus (0-5 points)
+    points, suffix = _ladder_score(price_impact, _PRICE_IMPACT_LADDER)
+    score += points
+    if suffix is not None:
+        rationale_parts.append(f"price impact {price_impact}%{suffix}")
+
+    # Global supply impact bonus (0-5 points); the smallest band adds no rationale
     global_impact = impacts.get("global_supply_impact_pct", 0)
-    if global_impact >= 5:
-        score += 5
-        rationale_parts.append(f"global supply {global_impact}% (significant)")
-    elif global_impact >= 2:
-        score += 3
-        rationale_parts.append(f"global supply {global_impact}%")
-    elif global_impact > 0:
-        score += 1
-
-    raw_score = min(score, max_score)
+    points, suffix = _ladder_score(global_impact, _GLOBAL_SUPPLY_LADDER)
+    score += points
+    if suffix is not None:
+        rationale_parts.append(f"global supply {global_impact}%{suffix}")
+
+    raw_score = min(score, _MAX_QUANTITATIVE)
     rationale = "; ".join(rationale_parts) if rationale_parts else "Minimal quantitative impact"
 
     return ConvictionComponent(
         name="Quantitative Magnitude",
         raw_score=raw_score,
-        max_score=max_score,
+        max_score=_MAX_QUANTITATIVE,
         rationale=rationale,
     )
 
@@ -325,29 +357,21 @@ def _score_channel_clarity(channels: list[str]) -> ConvictionComponent:
 
     More matched channels = clearer transmission path = higher score.
     """
-    config = COMPONENT_CONFIG["channel_clarity"]
-    max_score = config["max_score"]
-
     if not channels:
         return ConvictionComponent(
             name="Channel Clarity",
             raw_score=0,
-            max_score=max_score,
+            max_score=_MAX_CHANNEL,
             rationale="No transmission channels identified",
         )
 
     channel_count = len(channels)
-    if channel_count == 1:
-        raw_score = 10
-    elif channel_count == 2:
-        raw_score = 15
-    else:
-        raw_score = 20
+    raw_score, _ = _ladder_score(channel_count, _COUNT_LADDER)
 
     return ConvictionComponent(
         name="Channel Clarity",
-        raw_score=min(raw_score, max_score),
-        max_score=max_score,
+        raw_score=min(raw_score, _MAX_CHANNEL),
+        max_score=_MAX_CHANNEL,
         rationale=f"{channel_count} channel(s): {', '.join(channels[:3])}",
     )
 
@@ -356,27 +380,12 @@ def _score_timing_catalyst(clarity: str) -> ConvictionComponent:
     """
     Score based on timing/catalyst clarity.
     """
-    config = COMPONENT_CONFIG["timing_catalyst"]
-    max_score = config["max_score"]
-
-    clarity_lower = clarity.lower()
-    if clarity_lower == "high":
-        raw_score = 15
-        rationale = "Clear catalyst with specific timing"
-    elif clarity_lower == "medium":
-        raw_score = 10
-        rationale = "General timeframe identified"
-    elif clarity_lower == "low":
-        raw_score = 5
-        rationale = "Vague or uncertain timing"
-    else:
-        raw_score = 0
-        rationale = "No clear catalyst or timing"
+    raw_score, rationale = _TIMING_TABLE.get(clarity.lower(), _TIMING_TABLE["none"])
 
     return ConvictionComponent(
         name="Timing/Catalyst",
         raw_score=raw_score,
-        max_score=max_score,
+        max_score=_MAX_TIMING,
         rationale=rationale,
     )
 
@@ -387,27 +396,12 @@ def _score_counter_case(strength: str) -> ConvictionComponent:
 
     A strong counter-case reduces conviction; a weak one has minimal impact.
     """
-    config = COMPONENT_CONFIG["counter_case_discount"]
-    max_score = config["max_score"]
-
-    strength_lower = strength.lower()
-    if strength_lower == "strong":
-        raw_score = 15  # Will be negated by weight
-        rationale = "Strong counter-arguments present"
-    elif strength_lower == "moderate":
-        raw_score = 10
-        rationale = "Some valid concerns identified"
-    elif strength_lower == "weak":
-        raw_score = 5
-        rationale = "Minor concerns only"
-    else:
-        raw_score = 0
-        rationale = "No significant counter-case"
+    raw_score, rationale = _COUNTER_CASE_TABLE.get(strength.lower(), _COUNTER_CASE_TABLE["none"])
 
     return ConvictionComponent(
         name="Counter-Case Discount",
         raw_score=raw_score,
-        max_score=max_score,
+        max_score=_MAX_COUNTER_CASE,
         weight=-1.0,  # Negative weight = discount
         rationale=rationale,
     )
@@ -417,14 +411,7 @@ def _classify_conviction_level(score: float) -> ConvictionLevel:
     """
     Classify a numeric score into a conviction level.
     """
-    if score >= CONVICTION_THRESHOLDS[ConvictionLevel.HIGH]:
-        return ConvictionLevel.HIGH
-    elif score >= CONVICTION_THRESHOLDS[ConvictionLevel.MEDIUM]:
-        return ConvictionLevel.MEDIUM
-    elif score >= CONVICTION_THRESHOLDS[ConvictionLevel.LOW]:
-        return ConvictionLevel.LOW
-    else:
-        return ConvictionLevel.INSUFFICIENT
+    return _LEVELS[bisect_right(_LEVEL_CUTOFFS, score)]
 
 
 def format_conviction_for_prompt(result: ConvictionResult) -> str:
@@ -437,28 +424,26 @@ def format_conviction_for_prompt(result: ConvictionResult) -> str:
     Returns:
         Formatted string for prompt injection
     """
-    lines = ["=== CONVICTION ASSESSMENT ==="]
-    lines.append("")
-    lines.append(f"OVERALL: {result.level.value.upper()} ({result.total_score:.0f}/100)")
-    lines.append("")
-    lines.append("COMPONENT BREAKDOWN:")
+    lines = [
+        "=== CONVICTION ASSESSMENT ===",
+        "",
+        f"OVERALL: {result.level.value.upper()} ({result.total_score:.0f}/100)",
+        "",
+        "COMPONENT BREAKDOWN:",
+    ]
 
     for comp in result.components:
-        sign = "-" if comp.weight < 0 else "+"
+        score = comp.weighted_score
         if comp.weight < 0:
-            lines.append(f"  {comp.name}: {sign}{abs(comp.weighted_score):.0f} pts")
+            lines.append(f"  {comp.name}: -{abs(score):.0f} pts")
         else:
-            lines.append(f"  {comp.name}: {comp.weighted_score:.0f}/{comp.max_score:.0f} pts")
+            lines.append(f"  {comp.name}: {score:.0f}/{comp.max_score:.0f} pts")
         if comp.rationale:
             lines.append(f"    → {comp.rationale}")
 
     if result.warnings:
-        lines.append("")
-        lines.append("WARNINGS:")
-        for warning in result.warnings:
-            lines.append(f"  ⚠ {warning}")
+        lines += ["", "WARNINGS:", *(f"  ⚠ {warning}" for warning in result.warnings)]
 
-    lines.append("")
-    lines.append("=" * 27)
+    lines += ["", "=" * 27]
 
     return "\n".join(lines)
@@ -1,52 +1,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import re
-from typing import Iterable, Sequence
 
-import psycopg
-
-from app.analysis.significance import normalize_event_type
-from app.core.settings import get_settings, normalize_database_url
+from app.analysis.significance import EVENT_TYPE_ALIASES, normalize_event_type
+from app.core.settings import get_settings
 from app.db.embeddings import format_embedding
+from app.db.pool import get_pool
 
-STOPWORDS = {
-    "a",
-    "an",
-    "and",
-    "are",
-    "as",
-    "at",
-    "be",
-    "by",
-    "for",
-    "from",
-    "in",
-    "is",
-    "it",
-    "of",
-    "on",
-    "or",
-    "that",
-    "the",
-    "to",
-    "with",
-}
-
-TOKEN_RE = re.compile(r"[a-z0-9]+")
 EVENT_TYPE_BOOST = 5
-
-
-@dataclass(frozen=True)
-class HistoricalCase:
-    event_name: str
-    date_range: str | None
-    event_type: str | None
-    significance_score: int | None
-    structural_drivers: Sequence[str] | None = None
-    lessons: Sequence[str] | None = None
-    counter_examples: Sequence[str] | None = None
-    traditional_market_reaction: Sequence[str] | None = None
+# SQL mirror of normalize_event_type's spelling cleanup; it must stay identical to
+# the expression indexed by idx_historical_cases_event_type_normalized.
+_CASE_TYPE_SQL = "replace(replace(lower(trim(event_type)), '-', '_'), ' ', '_')"
+# plainto_tsquery ANDs every lexeme, which a multi-word headline almost never
+# satisfies in full; OR them so a case sharing any keyword still matches.
+_KEYWORDS_TSQUERY_SQL = (
+    "replace(plainto_tsquery('english', %(event_text)s)::text, ' & ', ' | ')::tsquery"
+)
 
 
 @dataclass(frozen=True)
@@ -57,7 +26,7 @@ class HistoricalMatch:
     significance_score: int | None
     match_method: str
     distance: float | None = None
-    match_score: int | None = None
+    match_score: float | None = None
 
 
 def find_historical_cases(
@@ -75,22 +44,27 @@ def find_historical_cases(
 
 
 def find_similar_cases(embedding: list[float], *, limit: int = 5) -> list[HistoricalMatch]:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
     query = """
         SELECT event_name,
                date_range,
                event_type,
                significance_score,
-               embedding <-> %(embedding)s::vector AS distance
+               embedding <-> %(embedding)s::halfvec AS distance
         FROM historical_cases
-        WHERE embedding IS NOT NULL
-        ORDER BY embedding <-> %(embedding)s::vector
+        ORDER BY embedding <-> %(embedding)s::halfvec
         LIMIT %(limit)s
     """
+    # The ORDER BY is exactly `embedding <-> halfvec`, matching the halfvec_l2_ops
+    # HNSW index, and carries no WHERE clause the planner would have to post-filter.
+    # The index holds no NULL embeddings; should a seq scan ever be chosen they sort
+    # last and are dropped below.
     params = {"embedding": format_embedding(embedding), "limit": limit}
+    # HNSW returns at most ef_search candidates, so never search fewer than limit.
+    ef_search = max(get_settings().hnsw_ef_search, limit)
 
-    with psycopg.connect(database_url) as conn:
+    with get_pool().connection() as conn, conn.transaction():
+        # set_config(..., true) is SET LOCAL with a bindable value.
+        conn.execute("SELECT set_config('hnsw.ef_search', %s, true)", (str(ef_search),))
         rows = conn.execute(query, params).fetchall()
 
     return [
@@ -103,6 +77,7 @@ def find_similar_cases(embedding: list[float], *, limit: int = 5) -> list[Histor
             distance=float(row[4]),
         )
         for row in rows
+        if row[4] is not None
     ]
 
 
@@ -112,127 +87,69 @@ def fallback_matches(
     event_type: str | None = None,
     limit: int = 5,
 ) -> list[HistoricalMatch]:
-    cases = fetch_historical_cases()
-    return rank_cases(cases, event_text=event_text, event_type=event_type, limit=limit)
-
+    """Rank cases by full-text relevance plus an event-type boost inside Postgres.
 
-def fetch_historical_cases() -> list[HistoricalCase]:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
-    query = """
+    Only cases matching the text or the event type are considered, which lets the
+    GIN index on ``search_vector`` and the normalized-type index drive the scan;
+    only the top ``limit`` rows cross the wire. With no text and no type every
+    case is eligible, every score ties at zero and the order falls back to
+    significance.
+    """
+    # Case types are stored raw, so match every spelling that normalizes to ours.
+    normalized_event_type = normalize_event_type(event_type)
+    type_spellings = _event_type_spellings(normalized_event_type)
+    match_filter = ""
+    if event_text or type_spellings:
+        match_filter = f"WHERE search_vector @@ keywords OR {_CASE_TYPE_SQL} = ANY(%(event_types)s)"
+    query = f"""
         SELECT event_name,
                date_range,
                event_type,
                significance_score,
-               structural_drivers,
-               lessons,
-               counter_examples,
-               traditional_market_reaction
-        FROM historical_cases
+               ts_rank_cd(search_vector, keywords)
+                 + CASE
+                     WHEN {_CASE_TYPE_SQL} = ANY(%(event_types)s)
+                     THEN %(boost)s
+                     ELSE 0
+                   END AS match_score
+        FROM historical_cases,
+             {_KEYWORDS_TSQUERY_SQL} AS keywords
+        {match_filter}
+        ORDER BY match_score DESC,
+                 significance_score DESC NULLS LAST,
+                 lower(event_name),
+                 coalesce(date_range, '')
+        LIMIT %(limit)s
     """
-
-    with psycopg.connect(database_url) as conn:
-        rows = conn.execute(query).fetchall()
+    params = {
+        "event_text": event_text or "",
+        "event_types": type_spellings,
+        "boost": EVENT_TYPE_BOOST,
+        "limit": limit,
+    }
+
+    with get_pool().connection() as conn:
+        rows = conn.execute(query, params).fetchall()
 
     return [
-        HistoricalCase(
+        HistoricalMatch(
             event_name=row[0],
             date_range=row[1],
             event_type=row[2],
             significance_score=row[3],
-            structural_drivers=row[4],
-            lessons=row[5],
-            counter_examples=row[6],
-            traditional_market_reaction=row[7],
+            match_method="fallback",
+            match_score=float(row[4]),
         )
         for row in rows
     ]
 
 
-def extract_keywords(text: str | None) -> set[str]:
-    if not text:
-        return set()
-    tokens = TOKEN_RE.findall(text.lower())
-    return {token for token in tokens if len(token) >= 3 and token not in STOPWORDS}
-
-
-def rank_cases(
-    cases: Iterable[HistoricalCase],
-    *,
-    event_text: str | None = None,
-    event_type: str | None = None,
-    limit: int = 5,
-) -> list[HistoricalMatch]:
-    case_list = list(cases)
-    if not case_list:
+def _event_type_spellings(normalized_event_type: str | None) -> list[str]:
+    if not normalized_event_type:
         return []
-
-    keywords = extract_keywords(event_text)
-    normalized_event_type = normalize_event_type(event_type)
-
-    scored: list[tuple[int, HistoricalCase]] = []
-    for case in case_list:
-        match_score = _score_case(case, keywords, normalized_event_type)
-        scored.append((match_score, case))
-
-    scored.sort(key=lambda item: _fallback_sort_key(item[0], item[1]))
-    matches: list[HistoricalMatch] = []
-    for match_score, case in scored[:limit]:
-        matches.append(
-            HistoricalMatch(
-                event_name=case.event_name,
-                date_range=case.date_range,
-                event_type=case.event_type,
-                significance_score=case.significance_score,
-                match_method="fallback",
-                match_score=match_score,
-            )
-        )
-    return matches
-
-
-def _score_case(
-    case: HistoricalCase,
-    keywords: set[str],
-    normalized_event_type: str | None,
-) -> int:
-    match_score = _keyword_hits(_case_text(case), keywords)
-    if normalized_event_type:
-        case_type = normalize_event_type(case.event_type)
-        if case_type == normalized_event_type:
-            match_score += EVENT_TYPE_BOOST
-    return match_score
-
-
-def _case_text(case: HistoricalCase) -> str:
-    parts: list[str] = []
-    for value in (
-        case.event_name,
-        case.event_type,
-        *_safe_list(case.structural_drivers),
-        *_safe_list(case.lessons),
-        *_safe_list(case.counter_examples),
-        *_safe_list(case.traditional_market_reaction),
-    ):
-        if value:
-            parts.append(value)
-    return " ".join(parts).lower()
-
-
-def _safe_list(values: Sequence[str] | None) -> list[str]:
-    if not values:
-        return []
-    return [value for value in values if value]
-
-
-def _keyword_hits(text: str, keywords: set[str]) -> int:
-    if not keywords:
-        return 0
-    return sum(1 for keyword in keywords if keyword in text)
-
-
-def _fallback_sort_key(match_score: int, case: HistoricalCase) -> tuple[int, int, str, str]:
-    significance = case.significance_score or 0
-    name = case.event_name.lower()
-    date_range = case.date_range or ""
-    return (-match_score, -significance, name, date_range)
+    aliases = [
+        alias
+        for alias, canonical in EVENT_TYPE_ALIASES.items()
+        if canonical == normalized_event_type
+    ]
+    return [normalized_event_type, *aliases]
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-import json
-from typing import Any, Iterable, Protocol
+from functools import lru_cache
+from typing import Any, Iterable, Protocol, Self, Sequence
 import uuid
 
-import psycopg
+import httpx
+import orjson
+from psycopg.rows import class_row
 from psycopg.types.json import Json
 
 from app.analysis.transmission import evaluate_transmission, normalize_crypto_transmission
@@ -16,7 +21,8 @@ from app.analysis.asset_discovery import (
     format_discovery_for_prompt,
     DiscoveryResult,
 )
-from app.core.settings import get_settings, normalize_database_url
+from app.core.settings import get_settings
+from app.db.pool import get_pool
 
 METAL_KEYS = ("gold", "silver", "copper")
 
@@ -110,14 +116,36 @@ class MacroEventAnalysis:
     discovery_result: DiscoveryResult | None = None  # New: raw discovery data
 
 
+@dataclass(frozen=True)
+class PromptContext:
+    """The structured payloads a prompt was rendered from."""
+
+    event: dict[str, Any]
+    cases: list[dict[str, Any]]
+
+
 class LlmProvider(Protocol):
     def complete(self, prompt: str) -> str: ...
 
 
 class LocalHeuristicProvider:
     def complete(self, prompt: str) -> str:
-        event_payload = _extract_json_block(prompt, "EVENT_JSON") or {}
-        cases_payload = _extract_json_block(prompt, "HISTORICAL_CASES_JSON") or []
+        return orjson.dumps(self.complete_payload(prompt)).decode()
+
+    def complete_payload(
+        self, prompt: str, *, context: PromptContext | None = None
+    ) -> dict[str, Any]:
+        """Build the response as a dict, skipping the JSON encode/decode round-trip.
+
+        With ``context`` the event and cases are read from it directly; otherwise
+        they are parsed back out of the rendered prompt.
+        """
+        if context is not None:
+            event_payload: dict[str, Any] = context.event
+            cases_payload: list[Any] = context.cases
+        else:
+            event_payload = _extract_json_block(prompt, "EVENT_JSON") or {}
+            cases_payload = _extract_json_block(prompt, "HISTORICAL_CASES_JSON") or []
 
         headline = str(event_payload.get("headline") or "").strip()
         full_text = str(event_payload.get("full_text") or "").strip()
@@ -163,7 +191,7 @@ class LocalHeuristicProvider:
             "crypto_transmission": evaluate_transmission(event_text, event_type),
             "thesis_seed": "insufficient data",
         }
-        return json.dumps(payload)
+        return payload
 
 
 class OpenRouterProvider:
@@ -176,38 +204,63 @@ class OpenRouterProvider:
         app_url: str | None = None,
         app_title: str | None = None,
         timeout: int = 30,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         if not api_key:
             raise ValueError("MERIDIAN_OPENROUTER_API_KEY is required")
         if not model:
             raise ValueError("OpenRouter model is required")
-        self._api_key = api_key
         self._model = model
         self._base_url = base_url
-        self._app_url = app_url or ""
-        self._app_title = app_title or ""
-        self._timeout = timeout
+        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        if app_url:
+            headers["HTTP-Referer"] = app_url
+        if app_title:
+            headers["X-Title"] = app_title
+        # One keep-alive client per provider so a batch of events reuses the
+        # TCP/TLS connection instead of handshaking for every completion.
+        self._client = httpx.Client(headers=headers, timeout=timeout, transport=transport)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._client.close()
 
     def complete(self, prompt: str) -> str:
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
-        if self._app_url:
-            headers["HTTP-Referer"] = self._app_url
-        if self._app_title:
-            headers["X-Title"] = self._app_title
         payload = {
             "model": self._model,
             "messages": [{"role": "user", "content": prompt}],
             "temperature": 0.0,
             "max_tokens": 900,
         }
-        response = _post_json(self._base_url, payload, headers, timeout=self._timeout)
-        return _extract_openrouter_content(response)
+        try:
+            response = self._client.post(self._base_url, content=orjson.dumps(payload))
+        except httpx.HTTPError as exc:
+            raise RuntimeError(f"OpenRouter request failed: {exc}") from exc
+        if response.is_error:
+            raise RuntimeError(
+                "OpenRouter request failed: "
+                f"{response.status_code} {response.reason_phrase}. {response.text}"
+            )
+        if not response.content:
+            raise RuntimeError("OpenRouter response was empty")
+        return _extract_openrouter_content(orjson.loads(response.content))
+
+
+def build_prompt(request: AnalysisRequest, *, metals_json: str | None = None) -> str:
+    """Render the analysis prompt for one event.
+
+    ``metals_json`` is the pre-rendered knowledge base from ``format_metals_json``;
+    batch callers pass it so the (event-independent) payload is serialized once.
+    """
+    return _render_prompt(request, metals_json)[0]
 
 
-def build_prompt(request: AnalysisRequest) -> str:
+def _render_prompt(request: AnalysisRequest, metals_json: str | None) -> tuple[str, PromptContext]:
     event_payload = {
         "id": str(request.event.id),
         "source": request.event.source,
@@ -221,7 +274,8 @@ def build_prompt(request: AnalysisRequest) -> str:
         "entities": request.event.entities,
         "significance_score": request.event.significance_score,
     }
-    metals_payload = _format_metals_knowledge(request.metals_knowledge)
+    if metals_json is None:
+        metals_json = format_metals_json(request.metals_knowledge)
     cases_payload = [
         {
             "id": str(case.id),
@@ -249,20 +303,21 @@ def build_prompt(request: AnalysisRequest) -> str:
     else:
         discovered_assets_section = ""
 
-    return _PROMPT_TEMPLATE.format(
+    prompt = _PROMPT_TEMPLATE.format(
         market_context_section=market_context_section,
         discovered_assets_section=discovered_assets_section,
-        event_json=json.dumps(event_payload, indent=2, sort_keys=True),
-        metals_json=json.dumps(metals_payload, indent=2, sort_keys=True),
-        cases_json=json.dumps(cases_payload, indent=2, sort_keys=True),
+        event_json=_dump_prompt_json(event_payload),
+        metals_json=metals_json,
+        cases_json=_dump_prompt_json(cases_payload),
     )
+    return prompt, PromptContext(event=event_payload, cases=cases_payload)
 
 
 def parse_analysis_response(
-    response: str,
+    response: str | dict[str, Any],
     discovery_result: DiscoveryResult | None = None,
 ) -> MacroEventAnalysis:
-    payload = _parse_json_payload(response)
+    payload = _parse_json_payload(response) if isinstance(response, str) else response
     raw_facts = _normalize_raw_facts(_require_list(payload, "raw_facts"))
     metal_impacts = _normalize_metal_impacts(_require_dict(payload, "metal_impacts"))
     historical_precedent = _string_or_default(
@@ -308,11 +363,14 @@ def parse_analysis_response(
 
 
 def analyze_event(
-    provider: LlmProvider, request: AnalysisRequest, *, return_prompt: bool = False
+    provider: LlmProvider,
+    request: AnalysisRequest,
+    *,
+    return_prompt: bool = False,
+    metals_json: str | None = None,
 ) -> tuple[MacroEventAnalysis, str | None]:
-    prompt = build_prompt(request)
-    response = provider.complete(prompt)
-    analysis = parse_analysis_response(response)
+    prompt, context = _render_prompt(request, metals_json)
+    analysis = parse_analysis_response(_complete(provider, prompt, context))
     return analysis, prompt if return_prompt else None
 
 
@@ -325,6 +383,7 @@ def analyze_with_dynamic_discovery(
     include_market_context: bool = True,
     max_channels: int = 5,
     return_prompt: bool = False,
+    metals_json: str | None = None,
 ) -> tuple[MacroEventAnalysis, str | None]:
     """
     Analyze an event with dynamic asset discovery.
@@ -342,6 +401,7 @@ def analyze_with_dynamic_discovery(
         include_market_context: Whether to include market context
         max_channels: Maximum transmission channels to match
         return_prompt: Whether to return the rendered prompt
+        metals_json: Pre-rendered metals knowledge (see ``format_metals_json``)
 
     Returns:
         Tuple of (MacroEventAnalysis with discovery data, prompt if requested)
@@ -385,9 +445,10 @@ def analyze_with_dynamic_discovery(
         discovered_assets=discovered_assets_str,
     )
 
-    prompt = build_prompt(request)
-    response = provider.complete(prompt)
-    analysis = parse_analysis_response(response, discovery_result=discovery)
+    prompt, context = _render_prompt(request, metals_json)
+    analysis = parse_analysis_response(
+        _complete(provider, prompt, context), discovery_result=discovery
+    )
 
     return analysis, prompt if return_prompt else None
 
@@ -397,8 +458,6 @@ def fetch_priority_events(
     *,
     include_analyzed: bool = False,
 ) -> list[MacroEventRecord]:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
     query = """
         SELECT id,
                source,
@@ -426,28 +485,14 @@ def fetch_priority_events(
         query += " LIMIT %(limit)s"
         params["limit"] = limit
 
-    with psycopg.connect(database_url) as conn:
-        rows = conn.execute(query, params).fetchall()
-
-    return [
-        MacroEventRecord(
-            id=row[0],
-            source=row[1],
-            headline=row[2],
-            full_text=row[3],
-            published_at=row[4],
-            event_type=row[5],
-            regions=row[6],
-            entities=row[7],
-            significance_score=row[8],
-        )
-        for row in rows
-    ]
+    with (
+        get_pool().connection() as conn,
+        conn.cursor(row_factory=class_row(MacroEventRecord)) as cur,
+    ):
+        return cur.execute(query, params).fetchall()
 
 
 def fetch_event_by_id(event_id: uuid.UUID) -> MacroEventRecord | None:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
     query = """
         SELECT id,
                source,
@@ -461,34 +506,31 @@ def fetch_event_by_id(event_id: uuid.UUID) -> MacroEventRecord | None:
         FROM macro_events
         WHERE id = %(id)s
     """
-    with psycopg.connect(database_url) as conn:
-        row = conn.execute(query, {"id": event_id}).fetchone()
-    if row is None:
-        return None
-    return MacroEventRecord(
-        id=row[0],
-        source=row[1],
-        headline=row[2],
-        full_text=row[3],
-        published_at=row[4],
-        event_type=row[5],
-        regions=row[6],
-        entities=row[7],
-        significance_score=row[8],
-    )
+    with (
+        get_pool().connection() as conn,
+        conn.cursor(row_factory=class_row(MacroEventRecord)) as cur,
+    ):
+        return cur.execute(query, {"id": event_id}).fetchone()
 
 
 def fetch_metals_knowledge() -> list[MetalsKnowledgeEntry]:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
     query = """
         SELECT metal, category, content
         FROM metals_knowledge
         ORDER BY metal, category
     """
-    with psycopg.connect(database_url) as conn:
-        rows = conn.execute(query).fetchall()
-    return [MetalsKnowledgeEntry(metal=row[0], category=row[1], content=row[2]) for row in rows]
+    with (
+        get_pool().connection() as conn,
+        conn.cursor(row_factory=class_row(MetalsKnowledgeEntry)) as cur,
+    ):
+        return cur.execute(query).fetchall()
+
+
+_CASE_SUMMARY_COLUMNS = (
+    "id, event_name, date_range, event_type, significance_score, metal_impacts, "
+    "crypto_transmission, lessons, counter_examples, quantitative_impacts, "
+    "time_horizon_behavior, transmission_channels"
+)
 
 
 def fetch_historical_cases(
@@ -496,47 +538,65 @@ def fetch_historical_cases(
     *,
     limit: int = 5,
 ) -> list[HistoricalCaseSummary]:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
-    query = """
-        SELECT id,
-               event_name,
-               date_range,
-               event_type,
-               significance_score,
-               metal_impacts,
-               crypto_transmission,
-               lessons,
-               counter_examples,
-               quantitative_impacts,
-               time_horizon_behavior,
-               transmission_channels
-        FROM historical_cases
-    """
+    query = f"SELECT {_CASE_SUMMARY_COLUMNS} FROM historical_cases"
     params: dict[str, object] = {"limit": limit}
     if event_type:
         query += " WHERE event_type = %(event_type)s"
         params["event_type"] = event_type
     query += " ORDER BY significance_score DESC NULLS LAST LIMIT %(limit)s"
-    with psycopg.connect(database_url) as conn:
-        rows = conn.execute(query, params).fetchall()
-    return [
-        HistoricalCaseSummary(
-            id=row[0],
-            event_name=row[1],
-            date_range=row[2],
-            event_type=row[3],
-            significance_score=row[4],
-            metal_impacts=row[5],
-            crypto_transmission=row[6],
-            lessons=row[7],
-            counter_examples=row[8],
-            quantitative_impacts=row[9],
-            time_horizon_behavior=row[10],
-            transmission_channels=row[11],
+    with (
+        get_pool().connection() as conn,
+        conn.cursor(row_factory=class_row(HistoricalCaseSummary)) as cur,
+    ):
+        return cur.execute(query, params).fetchall()
+
+
+def fetch_historical_cases_by_types(
+    event_types: Iterable[str | None],
+    *,
+    limit: int = 5,
+) -> dict[str | None, list[HistoricalCaseSummary]]:
+    """Batch form of fetch_historical_cases: top ``limit`` cases per event type.
+
+    One query serves every type. A falsy type maps to the top cases overall,
+    matching fetch_historical_cases(None).
+    """
+    requested = set(event_types)
+    types = sorted(t for t in requested if t)
+    include_untyped = any(not t for t in requested)
+    if not types and not include_untyped:
+        return {}
+
+    query = f"""
+        WITH ranked AS (
+            SELECT event_type AS bucket,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY event_type ORDER BY significance_score DESC NULLS LAST
+                   ) AS case_rank,
+                   {_CASE_SUMMARY_COLUMNS}
+            FROM historical_cases
+            WHERE event_type = ANY(%(types)s)
+            UNION ALL
+            SELECT NULL,
+                   ROW_NUMBER() OVER (ORDER BY significance_score DESC NULLS LAST),
+                   {_CASE_SUMMARY_COLUMNS}
+            FROM historical_cases
+            WHERE %(include_untyped)s
         )
-        for row in rows
-    ]
+        SELECT * FROM ranked
+        WHERE case_rank <= %(limit)s
+        ORDER BY bucket NULLS FIRST, case_rank
+    """
+    params = {"types": types, "include_untyped": include_untyped, "limit": limit}
+    with get_pool().connection() as conn:
+        rows = conn.execute(query, params).fetchall()
+
+    by_bucket: dict[str | None, list[HistoricalCaseSummary]] = {t: [] for t in types}
+    by_bucket[None] = []
+    for row in rows:
+        by_bucket[row[0]].append(_case_summary(row[2:]))
+    untyped = by_bucket.pop(None)
+    return {t: by_bucket[t] if t else list(untyped) for t in requested}
 
 
 def update_event_analysis(
@@ -545,8 +605,6 @@ def update_event_analysis(
     *,
     overwrite: bool = False,
 ) -> bool:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
     query = """
         UPDATE macro_events
         SET raw_facts = %(raw_facts)s,
@@ -572,11 +630,30 @@ def update_event_analysis(
         "counter_case": analysis.counter_case,
         "crypto_transmission": Json(analysis.crypto_transmission),
     }
-    with psycopg.connect(database_url) as conn:
+    with get_pool().connection() as conn:
         result = conn.execute(query, params)
     return (result.rowcount or 0) > 0
 
 
+# The batch query prefixes bucket/rank columns the dataclass has no fields for,
+# so it builds summaries from the row slice instead of using class_row.
+def _case_summary(row: Sequence[Any]) -> HistoricalCaseSummary:
+    return HistoricalCaseSummary(
+        id=row[0],
+        event_name=row[1],
+        date_range=row[2],
+        event_type=row[3],
+        significance_score=row[4],
+        metal_impacts=row[5],
+        crypto_transmission=row[6],
+        lessons=row[7],
+        counter_examples=row[8],
+        quantitative_impacts=row[9],
+        time_horizon_behavior=row[10],
+        transmission_channels=row[11],
+    )
+
+
 def _format_metals_knowledge(entries: Iterable[MetalsKnowledgeEntry]) -> dict[str, Any]:
     grouped: dict[str, dict[str, Any]] = {}
     for entry in entries:
@@ -584,13 +661,39 @@ def _format_metals_knowledge(entries: Iterable[MetalsKnowledgeEntry]) -> dict[st
     return grouped
 
 
+def _complete(provider: LlmProvider, prompt: str, context: PromptContext) -> str | dict[str, Any]:
+    # The local provider works on the structured payloads and returns a dict, so
+    # neither the prompt blocks nor its response need a JSON round-trip.
+    if isinstance(provider, LocalHeuristicProvider):
+        return provider.complete_payload(prompt, context=context)
+    return provider.complete(prompt)
+
+
+def format_metals_json(entries: Iterable[MetalsKnowledgeEntry]) -> str:
+    return _dump_prompt_json(_format_metals_knowledge(entries))
+
+
+# Compact output: the model does not need indentation, and it only adds
+# serialization time and prompt tokens. orjson also leaves non-ASCII text
+# unescaped, which keeps headlines readable (and shorter) in the prompt.
+def _dump_prompt_json(payload: Any) -> str:
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+
+
 def _parse_json_payload(response: str) -> dict[str, Any]:
     text = response.strip()
     if text.startswith("```"):
         text = text.strip("`")
         if text.startswith("json"):
             text = text[4:].strip()
-    return json.loads(text)
+    return orjson.loads(text)
+
+
+_METAL_IMPACT_DEFAULTS = {
+    "direction": "unknown",
+    "magnitude": "unknown",
+    "driver": "insufficient data",
+}
 
 
 def _normalize_raw_facts(items: list[Any]) -> list[str]:
@@ -613,9 +716,8 @@ def _normalize_metal_impacts(payload: dict[str, Any]) -> dict[str, Any]:
         if not isinstance(entry, dict):
             entry = {}
         normalized[metal] = {
-            "direction": _string_or_default(entry.get("direction"), "unknown"),
-            "magnitude": _string_or_default(entry.get("magnitude"), "unknown"),
-            "driver": _string_or_default(entry.get("driver"), "insufficient data"),
+            field: _string_or_default(entry.get(field), default)
+            for field, default in _METAL_IMPACT_DEFAULTS.items()
         }
     return normalized
 
@@ -665,30 +767,7 @@ def _extract_json_block(prompt: str, label: str) -> Any | None:
     block = prompt[start:end].strip()
     if not block:
         return None
-    return json.loads(block)
-
-
-def _post_json(
-    url: str,
-    payload: dict[str, Any],
-    headers: dict[str, str],
-    *,
-    timeout: int,
-) -> dict[str, Any]:
-    import urllib.error
-    import urllib.request
-
-    data = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(url, data=data, headers=headers, method="POST")
-    try:
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            body = response.read().decode("utf-8", errors="ignore")
-    except urllib.error.HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"OpenRouter request failed: {exc.code} {exc.reason}. {body}") from exc
-    if not body:
-        raise RuntimeError("OpenRouter response was empty")
-    return json.loads(body)
+    return orjson.loads(block)
 
 
 def _extract_openrouter_content(payload: dict[str, Any]) -> str:
@@ -721,8 +800,10 @@ def run_analysis(
     print_prompts: bool = False,
     include_market_context: bool = True,
     with_discovery: bool = False,
+    concurrency: int | None = None,
 ) -> dict[str, int]:
     metals_knowledge = fetch_metals_knowledge()
+    metals_json = format_metals_json(metals_knowledge)
     summary = {"analyzed": 0, "skipped": 0, "discoveries": 0}
 
     # Fetch market context once for all events (only if not using discovery mode)
@@ -742,59 +823,92 @@ def run_analysis(
             # Market context is optional - continue without it
             pass
 
-    for event in events:
-        cases = fetch_historical_cases(event.event_type)
+    events = list(events)
+    cases_by_type = fetch_historical_cases_by_types({event.event_type for event in events})
 
+    def analyze(event: MacroEventRecord) -> tuple[MacroEventAnalysis, str | None]:
+        cases = cases_by_type.get(event.event_type, [])
         if with_discovery:
             # Use dynamic discovery mode
-            analysis, prompt = analyze_with_dynamic_discovery(
+            return analyze_with_dynamic_discovery(
                 provider,
                 event,
                 metals_knowledge,
                 cases,
                 include_market_context=include_market_context,
                 return_prompt=print_prompts,
+                metals_json=metals_json,
             )
-            if analysis.discovery_result and analysis.discovery_result.channels:
-                summary["discoveries"] += 1
-        else:
-            # Standard analysis mode
-            analysis, prompt = analyze_event(
-                provider,
-                AnalysisRequest(event, metals_knowledge, cases, market_context_str),
-                return_prompt=print_prompts,
-            )
-
-        if print_prompts and prompt:
-            print(prompt)
-
-        if dry_run:
-            summary["analyzed"] += 1
-            continue
+        # Standard analysis mode
+        return analyze_event(
+            provider,
+            AnalysisRequest(event, metals_knowledge, cases, market_context_str),
+            return_prompt=print_prompts,
+            metals_json=metals_json,
+        )
 
-        updated = update_event_analysis(event.id, analysis, overwrite=overwrite)
-        if updated:
-            summary["analyzed"] += 1
-        else:
-            summary["skipped"] += 1
+    # Provider calls are independent network round-trips, so run them on a
+    # thread pool. At most `workers` calls are in flight and results are taken
+    # in event order, keeping printing and DB writes sequential on this thread;
+    # if a call fails, queued events are cancelled rather than paid for.
+    if concurrency is None:
+        concurrency = get_settings().analysis_concurrency
+    workers = max(1, concurrency)
+    remaining = iter(events)
+    pending: deque[tuple[MacroEventRecord, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                while len(pending) < workers and (event := next(remaining, None)) is not None:
+                    pending.append((event, executor.submit(analyze, event)))
+                if not pending:
+                    break
+
+                event, future = pending.popleft()
+                analysis, prompt = future.result()
+                if analysis.discovery_result and analysis.discovery_result.channels:
+                    summary["discoveries"] += 1
+
+                if print_prompts and prompt:
+                    print(prompt)
+
+                if dry_run:
+                    summary["analyzed"] += 1
+                    continue
+
+                updated = update_event_analysis(event.id, analysis, overwrite=overwrite)
+                if updated:
+                    summary["analyzed"] += 1
+                else:
+                    summary["skipped"] += 1
+        finally:
+            for _, future in pending:
+                future.cancel()
 
     return summary
 
 
 def resolve_provider(name: str, model_override: str | None) -> LlmProvider:
     if name == "openrouter":
-        settings = get_settings()
-        model = model_override or settings.openrouter_model
-        return OpenRouterProvider(
-            api_key=settings.openrouter_api_key,
-            model=model,
-            base_url=settings.openrouter_base_url,
-            app_url=settings.openrouter_app_url or None,
-            app_title=settings.openrouter_app_title or None,
-        )
+        return _openrouter_provider(model_override or get_settings().openrouter_model)
     return LocalHeuristicProvider()
 
 
+@lru_cache
+def _openrouter_provider(model: str) -> OpenRouterProvider:
+    # Cached per model so API requests share the provider's keep-alive client.
+    settings = get_settings()
+    provider = OpenRouterProvider(
+        api_key=settings.openrouter_api_key,
+        model=model,
+        base_url=settings.openrouter_base_url,
+        app_url=settings.openrouter_app_url or None,
+        app_title=settings.openrouter_app_title or None,
+    )
+    atexit.register(provider.close)
+    return provider
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Analyze priority macro events")
     parser.add_argument("--event-id", type=uuid.UUID, help="Analyze a single event by id")
@@ -22,15 +22,15 @@ Usage:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import date
-import json
 import logging
+import math
 from typing import Any
 
-import psycopg
+import orjson
 
-from app.core.settings import get_settings, normalize_database_url
 from app.data.core_watchlist import (
     CREDIT_REGIME_THRESHOLDS,
     CURVE_REGIME_THRESHOLDS,
@@ -38,15 +38,43 @@ from app.data.core_watchlist import (
     VOLATILITY_REGIME_THRESHOLDS,
 )
 from app.ingestion.market_context import (
+    KeyLevels,
     MarketSnapshot,
     extract_key_levels,
     fetch_market_snapshot,
     snapshot_to_raw_json,
 )
+from app.db.pool import get_pool
 
 logger = logging.getLogger(__name__)
 
 
+def _regime_ladder(
+    thresholds: dict[str, dict[str, float]], key: str
+) -> tuple[list[float], list[str]]:
+    """Sort a regime threshold table into parallel (lower bounds, names) lists."""
+    ladder = sorted((bounds[key], regime) for regime, bounds in thresholds.items())
+    return [bound for bound, _ in ladder], [regime for _, regime in ladder]
+
+
+_VOLATILITY_BOUNDS, _VOLATILITY_REGIMES = _regime_ladder(VOLATILITY_REGIME_THRESHOLDS, "vix_min")
+_CURVE_BOUNDS, _CURVE_REGIMES = _regime_ladder(CURVE_REGIME_THRESHOLDS, "spread_min")
+_CREDIT_BOUNDS, _CREDIT_REGIMES = _regime_ladder(CREDIT_REGIME_THRESHOLDS, "spread_min")
+
+_VOLATILITY_SIZE_MULTIPLIERS: dict[str, float] = POSITION_SIZE_MULTIPLIERS["volatility"]
+_CREDIT_SIZE_MULTIPLIERS: dict[str, float] = POSITION_SIZE_MULTIPLIERS["credit"]
+
+
+def _classify_on_ladder(value: float, bounds: list[float], regimes: list[str]) -> str:
+    # The highest regime whose lower bound the value reaches. Values below every
+    # bound, and NaN (which compares false against all of them), fall to the
+    # lowest regime.
+    index = bisect_right(bounds, value) - 1
+    if index < 0 or math.isnan(value):
+        return regimes[0]
+    return regimes[index]
+
+
 @dataclass
 class RegimeClassification:
     """Classification of current market regimes."""
@@ -74,14 +102,7 @@ def classify_volatility_regime(vix_level: float | None) -> str:
     """
     if vix_level is None:
         return "unknown"
-
-    # Check thresholds from highest to lowest
-    for regime in ("crisis", "fear", "elevated", "normal", "calm"):
-        threshold = VOLATILITY_REGIME_THRESHOLDS[regime]["vix_min"]
-        if vix_level >= threshold:
-            return regime
-
-    return "calm"
+    return _classify_on_ladder(vix_level, _VOLATILITY_BOUNDS, _VOLATILITY_REGIMES)
 
 
 def classify_dollar_regime(
@@ -119,14 +140,7 @@ def classify_curve_regime(spread_2s10s: float | None) -> str:
     """
     if spread_2s10s is None:
         return "unknown"
-
-    # Check thresholds from highest to lowest
-    for regime in ("steep", "normal", "flat", "inverted"):
-        threshold = CURVE_REGIME_THRESHOLDS[regime]["spread_min"]
-        if spread_2s10s >= threshold:
-            return regime
-
-    return "inverted"
+    return _classify_on_ladder(spread_2s10s, _CURVE_BOUNDS, _CURVE_REGIMES)
 
 
 def classify_credit_regime(hy_spread: float | None) -> str:
@@ -139,33 +153,31 @@ def classify_credit_regime(hy_spread: float | None) -> str:
     """
     if hy_spread is None:
         return "unknown"
+    return _classify_on_ladder(hy_spread, _CREDIT_BOUNDS, _CREDIT_REGIMES)
 
-    # Check thresholds from highest to lowest
-    for regime in ("crisis", "stressed", "wide", "normal", "tight"):
-        threshold = CREDIT_REGIME_THRESHOLDS[regime]["spread_min"]
-        if hy_spread >= threshold:
-            return regime
 
-    return "tight"
-
-
-def classify_regimes(snapshot: MarketSnapshot) -> RegimeClassification:
+def classify_regimes(
+    snapshot: MarketSnapshot,
+    key_levels: KeyLevels | None = None,
+) -> RegimeClassification:
     """
     Classify all market regimes from a snapshot.
 
     Args:
         snapshot: A MarketSnapshot with all instrument values
+        key_levels: Optional pre-extracted levels (extracted if not provided)
 
     Returns:
         RegimeClassification with all four regime types
     """
-    key_levels = extract_key_levels(snapshot)
+    if key_levels is None:
+        key_levels = extract_key_levels(snapshot)
 
     return RegimeClassification(
-        volatility_regime=classify_volatility_regime(key_levels.get("vix_level")),
-        dollar_regime=classify_dollar_regime(key_levels.get("dxy_level")),
-        curve_regime=classify_curve_regime(key_levels.get("spread_2s10s")),
-        credit_regime=classify_credit_regime(key_levels.get("hy_spread")),
+        volatility_regime=classify_volatility_regime(key_levels.vix_level),
+        dollar_regime=classify_dollar_regime(key_levels.dxy_level),
+        curve_regime=classify_curve_regime(key_levels.spread_2s10s),
+        credit_regime=classify_credit_regime(key_levels.hy_spread),
     )
 
 
@@ -178,8 +190,8 @@ def calculate_position_multiplier(regimes: RegimeClassification) -> float:
 
     Returns: Float between 0.25 and 1.0
     """
-    vol_multiplier = POSITION_SIZE_MULTIPLIERS["volatility"].get(regimes.volatility_regime, 1.0)
-    credit_multiplier = POSITION_SIZE_MULTIPLIERS["credit"].get(regimes.credit_regime, 1.0)
+    vol_multiplier = _VOLATILITY_SIZE_MULTIPLIERS.get(regimes.volatility_regime, 1.0)
+    credit_multiplier = _CREDIT_SIZE_MULTIPLIERS.get(regimes.credit_regime, 1.0)
 
     # Take the minimum (most conservative)
     return min(vol_multiplier, credit_multiplier)
@@ -227,10 +239,9 @@ def build_market_context_record(
     Returns:
         MarketContextRecord ready for database insertion
     """
-    if regimes is None:
-        regimes = classify_regimes(snapshot)
-
     key_levels = extract_key_levels(snapshot)
+    if regimes is None:
+        regimes = classify_regimes(snapshot, key_levels)
     multiplier = calculate_position_multiplier(regimes)
     raw_prices, raw_fred = snapshot_to_raw_json(snapshot)
 
@@ -240,20 +251,20 @@ def build_market_context_record(
         dollar_regime=regimes.dollar_regime,
         curve_regime=regimes.curve_regime,
         credit_regime=regimes.credit_regime,
-        vix_level=key_levels.get("vix_level"),
-        dxy_level=key_levels.get("dxy_level"),
-        us10y_level=key_levels.get("us10y_level"),
-        us2y_level=key_levels.get("us2y_level"),
-        gold_level=key_levels.get("gold_level"),
-        oil_level=key_levels.get("oil_level"),
-        spx_level=key_levels.get("spx_level"),
-        btc_level=key_levels.get("btc_level"),
-        spread_2s10s=key_levels.get("spread_2s10s"),
-        hy_spread=key_levels.get("hy_spread"),
-        gold_silver_ratio=key_levels.get("gold_silver_ratio"),
-        copper_gold_ratio=key_levels.get("copper_gold_ratio"),
-        vix_term_structure=key_levels.get("vix_term_structure"),
-        spy_rsp_ratio=key_levels.get("spy_rsp_ratio"),
+        vix_level=key_levels.vix_level,
+        dxy_level=key_levels.dxy_level,
+        us10y_level=key_levels.us10y_level,
+        us2y_level=key_levels.us2y_level,
+        gold_level=key_levels.gold_level,
+        oil_level=key_levels.oil_level,
+        spx_level=key_levels.spx_level,
+        btc_level=key_levels.btc_level,
+        spread_2s10s=key_levels.spread_2s10s,
+        hy_spread=key_levels.hy_spread,
+        gold_silver_ratio=key_levels.gold_silver_ratio,
+        copper_gold_ratio=key_levels.copper_gold_ratio,
+        vix_term_structure=key_levels.vix_term_structure,
+        spy_rsp_ratio=key_levels.spy_rsp_ratio,
         suggested_size_multiplier=multiplier,
         raw_prices=raw_prices,
         raw_fred=raw_fred,
@@ -267,9 +278,6 @@ def upsert_market_context(record: MarketContextRecord) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
-
     query = """
         INSERT INTO market_context (
             id,
@@ -288,17 +296,12 @@ def upsert_market_context(record: MarketContextRecord) -> bool:
             btc_level,
             spread_2s10s,
             hy_spread,
-            gold_silver_ratio,
-            copper_gold_ratio,
-            vix_term_structure,
-            spy_rsp_ratio,
             suggested_size_multiplier,
             raw_prices,
-            raw_fred,
             created_at
         )
         VALUES (
-            gen_random_uuid(),
+            uuidv7(),
             %(context_date)s,
             %(volatility_regime)s,
             %(dollar_regime)s,
@@ -314,14 +317,9 @@ def upsert_market_context(record: MarketContextRecord) -> bool:
             %(btc_level)s,
             %(spread_2s10s)s,
             %(hy_spread)s,
-            %(gold_silver_ratio)s,
-            %(copper_gold_ratio)s,
-            %(vix_term_structure)s,
-            %(spy_rsp_ratio)s,
             %(suggested_size_multiplier)s,
             %(raw_prices)s,
-            %(raw_fred)s,
-            now()
+            timezone('utc', now())
         )
         ON CONFLICT (context_date)
         DO UPDATE SET
@@ -339,17 +337,21 @@ def upsert_market_context(record: MarketContextRecord) -> bool:
             btc_level = EXCLUDED.btc_level,
             spread_2s10s = EXCLUDED.spread_2s10s,
             hy_spread = EXCLUDED.hy_spread,
-            gold_silver_ratio = EXCLUDED.gold_silver_ratio,
-            copper_gold_ratio = EXCLUDED.copper_gold_ratio,
-            vix_term_structure = EXCLUDED.vix_term_structure,
-            spy_rsp_ratio = EXCLUDED.spy_rsp_ratio,
             suggested_size_multiplier = EXCLUDED.suggested_size_multiplier,
-            raw_prices = EXCLUDED.raw_prices,
-            raw_fred = EXCLUDED.raw_fred
+            raw_prices = EXCLUDED.raw_prices
+    """
+    # raw_fred lives in the UNLOGGED market_context_raw table to keep it out of WAL.
+    raw_query = """
+        INSERT INTO market_context_raw (context_date, raw_fred)
+        VALUES (%(context_date)s, %(raw_fred)s)
+        ON CONFLICT (context_date)
+        DO UPDATE SET raw_fred = EXCLUDED.raw_fred
     """
 
     try:
-        with psycopg.connect(database_url) as conn:
+        # Both rows commit together, as they did on a dedicated connection, and
+        # the pipeline sends both upserts without waiting on the first reply.
+        with get_pool().connection() as conn, conn.transaction(), conn.pipeline():
             conn.execute(
                 query,
                 {
@@ -368,13 +370,15 @@ def upsert_market_context(record: MarketContextRecord) -> bool:
                     "btc_level": record.btc_level,
                     "spread_2s10s": record.spread_2s10s,
                     "hy_spread": record.hy_spread,
-                    "gold_silver_ratio": record.gold_silver_ratio,
-                    "copper_gold_ratio": record.copper_gold_ratio,
-                    "vix_term_structure": record.vix_term_structure,
-                    "spy_rsp_ratio": record.spy_rsp_ratio,
                     "suggested_size_multiplier": record.suggested_size_multiplier,
-                    "raw_prices": json.dumps(record.raw_prices),
-                    "raw_fred": json.dumps(record.raw_fred),
+                    "raw_prices": orjson.dumps(record.raw_prices).decode(),
+                },
+            )
+            conn.execute(
+                raw_query,
+                {
+                    "context_date": record.context_date,
+                    "raw_fred": orjson.dumps(record.raw_fred).decode(),
                 },
             )
         logger.info("Market context upserted for %s", record.context_date)
@@ -391,9 +395,6 @@ def fetch_latest_market_context() -> MarketContextRecord | None:
     Returns:
         MarketContextRecord or None if not found
     """
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
-
     query = """
         SELECT
             context_date,
@@ -417,14 +418,15 @@ def fetch_latest_market_context() -> MarketContextRecord | None:
             spy_rsp_ratio,
             suggested_size_multiplier,
             raw_prices,
-            raw_fred
+            raw.raw_fred
         FROM market_context
+        LEFT JOIN market_context_raw AS raw USING (context_date)
         ORDER BY context_date DESC
         LIMIT 1
     """
 
     try:
-        with psycopg.connect(database_url) as conn:
+        with get_pool().connection() as conn:
             row = conn.execute(query).fetchone()
 
         if row is None:
@@ -470,14 +472,37 @@ def ingest_market_context(snapshot_date: date | None = None) -> MarketContextRec
         The stored MarketContextRecord, or None if failed
     """
     snapshot = fetch_market_snapshot(snapshot_date)
-    regimes = classify_regimes(snapshot)
-    record = build_market_context_record(snapshot, regimes)
+    record = build_market_context_record(snapshot)
 
     if upsert_market_context(record):
         return record
     return None
 
 
+# (record attribute, line format) for the optional KEY LEVELS / KEY RATIOS lines
+_KEY_LEVEL_LINES = (
+    ("vix_level", "  VIX: {:.2f}"),
+    ("dxy_level", "  DXY: {:.2f}"),
+    ("us10y_level", "  US10Y: {:.2f}"),
+    ("spread_2s10s", "  2s10s Spread: {:.2f}"),
+    ("gold_level", "  Gold: ${:.2f}"),
+    ("oil_level", "  Oil: ${:.2f}"),
+    ("spx_level", "  S&P 500: {:.2f}"),
+    ("btc_level", "  Bitcoin: ${:,.2f}"),
+    ("hy_spread", "  HY Spread: {:.0f}bps"),
+)
+_KEY_RATIO_LINES = (
+    ("gold_silver_ratio", "  Gold/Silver: {:.1f}"),
+    ("copper_gold_ratio", "  Copper/Gold: {:.4f}"),
+)
+
+
+def _optional_lines(record: MarketContextRecord, specs: tuple[tuple[str, str], ...]) -> list[str]:
+    return [
+        line.format(value) for attr, line in specs if (value := getattr(record, attr)) is not None
+    ]
+
+
 def format_context_for_llm(record: MarketContextRecord) -> str:
     """
     Format market context as a human-readable string for LLM prompts.
@@ -497,34 +522,12 @@ def format_context_for_llm(record: MarketContextRecord) -> str:
         f"  Suggested Position Size: {record.suggested_size_multiplier:.0%}",
         "",
         "KEY LEVELS:",
+        *_optional_lines(record, _KEY_LEVEL_LINES),
+        "",
+        "KEY RATIOS:",
+        *_optional_lines(record, _KEY_RATIO_LINES),
     ]
 
-    if record.vix_level is not None:
-        lines.append(f"  VIX: {record.vix_level:.2f}")
-    if record.dxy_level is not None:
-        lines.append(f"  DXY: {record.dxy_level:.2f}")
-    if record.us10y_level is not None:
-        lines.append(f"  US10Y: {record.us10y_level:.2f}")
-    if record.spread_2s10s is not None:
-        lines.append(f"  2s10s Spread: {record.spread_2s10s:.2f}")
-    if record.gold_level is not None:
-        lines.append(f"  Gold: ${record.gold_level:.2f}")
-    if record.oil_level is not None:
-        lines.append(f"  Oil: ${record.oil_level:.2f}")
-    if record.spx_level is not None:
-        lines.append(f"  S&P 500: {record.spx_level:.2f}")
-    if record.btc_level is not None:
-        lines.append(f"  Bitcoin: ${record.btc_level:,.2f}")
-    if record.hy_spread is not None:
-        lines.append(f"  HY Spread: {record.hy_spread:.0f}bps")
-
-    lines.append("")
-    lines.append("KEY RATIOS:")
-
-    if record.gold_silver_ratio is not None:
-        lines.append(f"  Gold/Silver: {record.gold_silver_ratio:.1f}")
-    if record.copper_gold_ratio is not None:
-        lines.append(f"  Copper/Gold: {record.copper_gold_ratio:.4f}")
     if record.vix_term_structure is not None:
         term = "backwardation (panic)" if record.vix_term_structure > 1 else "contango (normal)"
         lines.append(f"  VIX Term Structure: {record.vix_term_structure:.2f} ({term})")
@@ -2,17 +2,22 @@ from __future__ import annotations
 
 import argparse
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from functools import lru_cache
+import sys
+from typing import Iterable, Iterator, Sequence
 import uuid
 
-import psycopg
-from psycopg.types.json import Json
+import orjson
 
-from app.core.settings import get_settings, normalize_database_url
+from app.db.bulk import stage_rows
+from app.db.pool import get_pool
 
 PRIORITY_THRESHOLD = 65
 MONITORING_THRESHOLD = 50
 
+# Rows fetched per round-trip when streaming unscored events
+FETCH_CHUNK_SIZE = 5000
+
 STRUCTURAL_WEIGHT = 35
 TRANSMISSION_WEIGHT = 30
 HISTORICAL_WEIGHT = 20
@@ -63,7 +68,9 @@ EVENT_TYPE_ALIASES = {
     "energy": "supply_shock",
 }
 
-MAJOR_REGIONS = {"US", "EU", "CHINA", "UK", "JAPAN", "GLOBAL"}
+# Major sets are frozen and interned, as are canonical labels below, so the
+# per-event intersections hash-match on identity.
+MAJOR_REGIONS = frozenset(map(sys.intern, ("US", "EU", "CHINA", "UK", "JAPAN", "GLOBAL")))
 REGION_ALIASES = {
     "UNITED STATES": "US",
     "UNITED STATES OF AMERICA": "US",
@@ -79,21 +86,26 @@ REGION_ALIASES = {
     "WORLD": "GLOBAL",
 }
 
-MAJOR_ENTITIES = {
-    "federal reserve",
-    "fed",
-    "european central bank",
-    "ecb",
-    "people's bank of china",
-    "pboc",
-    "bank of japan",
-    "boj",
-    "bank of england",
-    "boe",
-    "imf",
-    "opec",
-    "treasury",
-}
+MAJOR_ENTITIES = frozenset(
+    map(
+        sys.intern,
+        (
+            "federal reserve",
+            "fed",
+            "european central bank",
+            "ecb",
+            "people's bank of china",
+            "pboc",
+            "bank of japan",
+            "boj",
+            "bank of england",
+            "boe",
+            "imf",
+            "opec",
+            "treasury",
+        ),
+    )
+)
 
 MONETARY_TERMS = ("rate", "rates", "central bank", "fed", "ecb", "boj", "pboc", "hike")
 CRISIS_TERMS = ("crisis", "default", "bank", "collapse", "liquidity", "bailout")
@@ -105,6 +117,10 @@ METAL_TERMS = ("gold", "silver", "copper", "metals", "bullion")
 MACRO_TERMS = ("rate", "rates", "inflation", "cpi", "yield", "usd", "dollar")
 HISTORICAL_TERMS = ("crisis", "default", "war", "recession", "sanction", "bank")
 ATTENTION_TERMS = ("breaking", "urgent", "emergency", "surprise", "unexpected", "shock")
+# Every term that can lift a component above its base score
+_BOOST_TERMS = tuple(
+    dict.fromkeys(METAL_TERMS + MACRO_TERMS + SUPPLY_TERMS + HISTORICAL_TERMS + ATTENTION_TERMS)
+)
 
 
 @dataclass(frozen=True)
@@ -142,6 +158,9 @@ class ScoredEvent:
     tier: str
 
 
+# Event types come from a small vocabulary and are normalized once per case per
+# ranking call, so the result is memoized.
+@lru_cache(maxsize=256)
 def normalize_event_type(value: str | None) -> str | None:
     if not value:
         return None
@@ -160,34 +179,53 @@ def classify_score(score: int) -> str:
 def score_event(event: MacroEvent) -> ScoredEvent:
     text = _normalize_text(event.headline, event.full_text)
     event_type = normalize_event_type(event.event_type) or _infer_event_type(text)
-    regions = _normalize_regions(event.regions)
-    entities = _normalize_entities(event.entities)
+    # The scorers only need how many major regions/entities are involved, so
+    # intersect once here instead of in every scorer.
+    major_regions = len(_normalize_regions(event.regions) & MAJOR_REGIONS)
+    major_entities = len(_normalize_entities(event.entities) & MAJOR_ENTITIES)
+
+    # Most headlines carry no type, no major actors and no boost terms; their
+    # score then depends on the source alone and is shared.
+    if (
+        event_type is None
+        and not major_regions
+        and not major_entities
+        and not _contains_any(text, _BOOST_TERMS)
+    ):
+        return _baseline_score(event.source)
 
-    structural = _score_structural(event_type, regions, entities)
-    transmission = _score_transmission(event_type, text, entities)
-    historical = _score_historical(event_type, text, regions)
-    attention = _score_attention(event.source, text, regions, entities)
+    return _build_scored_event(event_type, text, event.source, major_regions, major_entities)
 
+
+@lru_cache(maxsize=64)
+def _baseline_score(source: str) -> ScoredEvent:
+    return _build_scored_event(None, "", source, 0, 0)
+
+
+def _build_scored_event(
+    event_type: str | None,
+    text: str,
+    source: str,
+    major_regions: int,
+    major_entities: int,
+) -> ScoredEvent:
     components = ScoreComponents(
-        structural=structural,
-        transmission=transmission,
-        historical=historical,
-        attention=attention,
+        structural=_score_structural(event_type, major_regions, major_entities),
+        transmission=_score_transmission(event_type, text, major_entities),
+        historical=_score_historical(event_type, text, major_regions),
+        attention=_score_attention(source, text, major_regions, major_entities),
     )
     total_score = _weighted_total(components)
-    tier = classify_score(total_score)
 
     return ScoredEvent(
         total_score=total_score,
         components=components,
         priority_flag=total_score >= PRIORITY_THRESHOLD,
-        tier=tier,
+        tier=classify_score(total_score),
     )
 
 
-def fetch_events_to_score(limit: int | None = None) -> list[MacroEvent]:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
+def fetch_events_to_score(limit: int | None = None) -> Iterator[MacroEvent]:
     query = """
         SELECT id,
                source,
@@ -205,50 +243,64 @@ def fetch_events_to_score(limit: int | None = None) -> list[MacroEvent]:
         query += " LIMIT %(limit)s"
         params["limit"] = limit
 
-    with psycopg.connect(database_url) as conn:
-        rows = conn.execute(query, params).fetchall()
-
-    return [
-        MacroEvent(
-            id=row[0],
-            source=row[1],
-            headline=row[2],
-            full_text=row[3],
-            event_type=row[4],
-            regions=row[5],
-            entities=row[6],
-        )
-        for row in rows
-    ]
+    # A named (server-side) cursor streams the backlog in chunks instead of
+    # holding every headline and full_text in memory before scoring starts.
+    # Server-side cursors need a transaction, and the connection stays checked
+    # out until the generator is exhausted or closed.
+    with (
+        get_pool().connection() as conn,
+        conn.transaction(),
+        conn.cursor(name="score_events") as cur,
+    ):
+        cur.itersize = FETCH_CHUNK_SIZE
+        for row in cur.execute(query, params):
+            yield MacroEvent(
+                id=row[0],
+                source=row[1],
+                headline=row[2],
+                full_text=row[3],
+                event_type=row[4],
+                regions=row[5],
+                entities=row[6],
+            )
 
 
 def update_event_scores(events: Iterable[MacroEvent]) -> dict[str, int]:
-    settings = get_settings()
-    database_url = normalize_database_url(settings.database_url)
-    query = """
-        UPDATE macro_events
-        SET significance_score = %(significance_score)s,
-            score_components = %(score_components)s,
-            priority_flag = %(priority_flag)s
-        WHERE id = %(id)s
-    """
     summary = {"priority": 0, "monitoring": 0, "logged": 0}
 
-    with psycopg.connect(database_url) as conn:
+    def score_rows() -> Iterator[tuple[object, ...]]:
         for event in events:
             if event.id is None:
                 raise ValueError("MacroEvent id is required for updates")
             scored = score_event(event)
-            conn.execute(
-                query,
-                {
-                    "significance_score": scored.total_score,
-                    "score_components": Json(scored.components.as_dict()),
-                    "priority_flag": scored.priority_flag,
-                    "id": event.id,
-                },
-            )
             summary[scored.tier] += 1
+            yield (
+                event.id,
+                scored.total_score,
+                orjson.dumps(scored.components.as_dict()).decode(),
+                scored.priority_flag,
+            )
+
+    # Scores are COPYed into a staging table and applied with a single
+    # UPDATE ... FROM, avoiding per-row statement parsing and round-trips on
+    # large backfills. The staging table is dropped when the transaction commits.
+    with get_pool().connection() as conn, conn.transaction():
+        staging = stage_rows(
+            conn,
+            "macro_events",
+            ("id", "significance_score", "score_components", "priority_flag"),
+            score_rows(),
+        )
+        conn.execute(
+            f"""
+            UPDATE macro_events AS m
+            SET significance_score = s.significance_score,
+                score_components = s.score_components,
+                priority_flag = s.priority_flag
+            FROM {staging} AS s
+            WHERE m.id = s.id
+            """
+        )
 
     return summary
 
@@ -266,19 +318,19 @@ def _weighted_total(components: ScoreComponents) -> int:
 
 def _score_structural(
     event_type: str | None,
-    regions: set[str],
-    entities: set[str],
+    major_regions: int,
+    major_entities: int,
 ) -> int:
     base = STRUCTURAL_BASE.get(event_type or "", 40)
-    region_score = min(25, len(regions & MAJOR_REGIONS) * 8)
-    entity_score = min(15, len(entities & MAJOR_ENTITIES) * 5)
+    region_score = min(25, major_regions * 8)
+    entity_score = min(15, major_entities * 5)
     return _clamp(base + region_score + entity_score)
 
 
 def _score_transmission(
     event_type: str | None,
     text: str,
-    entities: set[str],
+    major_entities: int,
 ) -> int:
     base = TRANSMISSION_BASE.get(event_type or "", 35)
     boost = 0
@@ -288,7 +340,7 @@ def _score_transmission(
         boost += 10
     if _contains_any(text, SUPPLY_TERMS):
         boost += 10
-    if entities & MAJOR_ENTITIES:
+    if major_entities:
         boost += 5
     return _clamp(base + boost)
 
@@ -296,51 +348,53 @@ def _score_transmission(
 def _score_historical(
     event_type: str | None,
     text: str,
-    regions: set[str],
+    major_regions: int,
 ) -> int:
     base = HISTORICAL_BASE.get(event_type or "", 30)
     boost = 0
     if _contains_any(text, HISTORICAL_TERMS):
         boost += 10
-    if regions & MAJOR_REGIONS:
-        boost += min(10, len(regions & MAJOR_REGIONS) * 5)
+    if major_regions:
+        boost += min(10, major_regions * 5)
     return _clamp(base + boost)
 
 
 def _score_attention(
     source: str,
     text: str,
-    regions: set[str],
-    entities: set[str],
+    major_regions: int,
+    major_entities: int,
 ) -> int:
     base = SOURCE_ATTENTION_BASE.get(source.strip().lower(), 50)
     boost = 0
     if _contains_any(text, ATTENTION_TERMS):
         boost += 15
-    if len(regions & MAJOR_REGIONS) >= 2:
+    if major_regions >= 2:
         boost += 5
-    if len(entities & MAJOR_ENTITIES) >= 2:
+    if major_entities >= 2:
         boost += 5
     return _clamp(base + boost)
 
 
 def _normalize_regions(regions: Sequence[str] | None) -> set[str]:
-    normalized: set[str] = set()
-    for region in regions or []:
-        if not region:
-            continue
-        key = region.strip().upper()
-        normalized.add(REGION_ALIASES.get(key, key))
-    return normalized
+    return {_canonical_region(region) for region in regions or () if region}
 
 
 def _normalize_entities(entities: Sequence[str] | None) -> set[str]:
-    normalized: set[str] = set()
-    for entity in entities or []:
-        if not entity:
-            continue
-        normalized.add(entity.strip().lower())
-    return normalized
+    return {_canonical_entity(entity) for entity in entities or () if entity}
+
+
+# Region and entity labels repeat heavily across events, so the per-label
+# cleanup and alias lookup are memoized.
+@lru_cache(maxsize=1024)
+def _canonical_region(region: str) -> str:
+    key = region.strip().upper()
+    return sys.intern(REGION_ALIASES.get(key, key))
+
+
+@lru_cache(maxsize=1024)
+def _canonical_entity(entity: str) -> str:
+    return sys.intern(entity.strip().lower())
 
 
 def _infer_event_type(text: str) -> str | None:
@@ -388,23 +442,27 @@ def main() -> None:
     args = parser.parse_args()
 
     events = fetch_events_to_score(args.limit)
-    if not events:
+
+    if args.dry_run:
+        summary = {"priority": 0, "monitoring": 0, "logged": 0}
+        for event in events:
+            summary[score_event(event).tier] += 1
+    else:
+        summary = update_event_scores(events)
+
+    scored = sum(summary.values())
+    if not scored:
         print("No macro events found without significance scores.")
         return
 
     if args.dry_run:
-        scored = [score_event(event) for event in events]
-        summary = {"priority": 0, "monitoring": 0, "logged": 0}
-        for result in scored:
-            summary[result.tier] += 1
         print(
             "Dry run: "
-            f"scored={len(scored)}, priority={summary['priority']}, "
+            f"scored={scored}, priority={summary['priority']}, "
             f"monitoring={summary['monitoring']}, logged={summary['logged']}"
         )
         return
 
-    summary = update_event_scores(events)
     print(
         "Scored macro events: "
         f"priority={summary['priority']}, "
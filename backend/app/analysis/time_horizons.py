@@ -51,7 +51,7 @@ class TradeDirection(Enum):
     NEUTRAL = "neutral"  # e.g., straddle, pairs trade
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizonRecommendation:
     """A trading recommendation for a specific time horizon."""
 
@@ -81,7 +81,7 @@ class HorizonRecommendation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class HorizonAnalysis:
     """Complete horizon analysis with recommendations for all timeframes."""
 
@@ -242,6 +242,18 @@ DEFAULT_INSTRUMENTS: dict[TradeHorizon, list[str]] = {
     TradeHorizon.LONG_TERM: ["SPY", "QQQ", "VTI", "MSFT", "GOOGL", "NEM"],
 }
 
+# Deduplicated instruments per (horizon, channel), flattened at import so
+# lookups are a single dict hit instead of a per-call horizon dispatch
+_CHANNEL_INSTRUMENTS: dict[tuple[TradeHorizon, str], tuple[str, ...]] = {
+    (horizon, channel_type): tuple(dict.fromkeys(instruments))
+    for horizon, mapping in (
+        (TradeHorizon.SHORT_TERM, SHORT_TERM_INSTRUMENTS),
+        (TradeHorizon.MEDIUM_TERM, MEDIUM_TERM_INSTRUMENTS),
+        (TradeHorizon.LONG_TERM, LONG_TERM_INSTRUMENTS),
+    )
+    for channel_type, instruments in mapping.items()
+}
+
 # Entry approach by horizon
 ENTRY_APPROACHES: dict[TradeHorizon, list[str]] = {
     TradeHorizon.SHORT_TERM: [
@@ -302,21 +314,16 @@ def get_instruments_for_horizon(
     Returns:
         Deduplicated list of instrument symbols
     """
-    instrument_map = {
-        TradeHorizon.SHORT_TERM: SHORT_TERM_INSTRUMENTS,
-        TradeHorizon.MEDIUM_TERM: MEDIUM_TERM_INSTRUMENTS,
-        TradeHorizon.LONG_TERM: LONG_TERM_INSTRUMENTS,
-    }
-
-    mapping = instrument_map.get(horizon, {})
     instruments: list[str] = []
     seen: set[str] = set()
+    is_seen = seen.__contains__
+    mark_seen = seen.add
 
     # Get instruments from matched channels
     for channel_type in channel_types:
-        for instrument in mapping.get(channel_type, []):
-            if instrument not in seen:
-                seen.add(instrument)
+        for instrument in _CHANNEL_INSTRUMENTS.get((horizon, channel_type), ()):
+            if not is_seen(instrument):
+                mark_seen(instrument)
                 instruments.append(instrument)
                 if len(instruments) >= max_instruments:
                     return instruments
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 import re
 
 from app.analysis.significance import normalize_event_type
@@ -30,12 +32,25 @@ CRYPTO_ASSET_ALIASES = {
 LIQUIDITY_TERMS = ("liquidity", "rates", "rate", "yield", "dollar", "tightening", "easing")
 RISK_TERMS = ("risk-off", "risk on", "risk-on", "risk aversion", "risk appetite")
 SANCTION_TERMS = ("sanction", "capital control", "controls", "restriction")
+LIQUIDITY_EVENT_TYPES = frozenset({"monetary_policy", "financial_crisis"})
 
-TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Matches only whole-token alias hits (tokens being [a-z0-9]+ runs), so one
+# scan emits aliases instead of tokenizing the entire text.
+_ASSET_ALIAS_ALTERNATION = "|".join(
+    map(re.escape, sorted(CRYPTO_ASSET_ALIASES, key=len, reverse=True))
+)
+ASSET_ALIAS_RE = re.compile(rf"(?<![a-z0-9])(?:{_ASSET_ALIAS_ALTERNATION})(?![a-z0-9])")
+
+
+# Shared read-only "no transmission" result; default_transmission() hands out
+# mutable copies for payloads that are later normalized or serialized.
+_DEFAULT_TRANSMISSION: Mapping[str, Any] = MappingProxyType(
+    {"exists": False, "path": "", "strength": "none", "relevant_assets": ()}
+)
 
 
 def default_transmission() -> dict[str, Any]:
-    return {"exists": False, "path": "", "strength": "none", "relevant_assets": []}
+    return {**_DEFAULT_TRANSMISSION, "relevant_assets": []}
 
 
 def normalize_crypto_transmission(payload: dict[str, Any] | None) -> dict[str, Any]:
@@ -69,35 +84,32 @@ def normalize_relevant_assets(value: object) -> list[str]:
         assets = [item.strip() for item in value.split(",") if item.strip()]
     elif isinstance(value, list):
         assets = [item.strip() for item in value if isinstance(item, str) and item.strip()]
-    normalized = [_normalize_asset(asset) for asset in assets]
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for asset in normalized:
-        if asset not in seen:
-            seen.add(asset)
-            deduped.append(asset)
-    return deduped
+    return _dedupe(_normalize_asset(asset) for asset in assets)
 
 
 def extract_relevant_assets(text: str | None) -> list[str]:
     if not text:
         return []
-    tokens = TOKEN_RE.findall(text.lower())
-    assets = [_normalize_asset(token) for token in tokens if token in CRYPTO_ASSET_ALIASES]
-    deduped: list[str] = []
-    seen: set[str] = set()
-    for asset in assets:
-        if asset not in seen:
-            seen.add(asset)
-            deduped.append(asset)
-    return deduped
+    return _dedupe(CRYPTO_ASSET_ALIASES[alias] for alias in ASSET_ALIAS_RE.findall(text.lower()))
 
 
 def evaluate_transmission(event_text: str | None, event_type: str | None) -> dict[str, Any]:
     text = (event_text or "").lower()
-    if not text:
-        return default_transmission()
+    result = (
+        _evaluate_transmission_cached(text, normalize_event_type(event_type))
+        if text
+        else _DEFAULT_TRANSMISSION
+    )
+    # Results are shared, so callers get their own dict and asset list.
+    return {**result, "relevant_assets": list(result["relevant_assets"])}
 
+
+# Evaluation is pure over the lowercased text and normalized event type, and
+# the same event is re-evaluated across analysis passes.
+@lru_cache(maxsize=1024)
+def _evaluate_transmission_cached(
+    text: str, normalized_event_type: str | None
+) -> Mapping[str, Any]:
     assets = extract_relevant_assets(text)
     if assets:
         return normalize_crypto_transmission(
@@ -109,11 +121,8 @@ def evaluate_transmission(event_text: str | None, event_type: str | None) -> dic
             }
         )
 
-    normalized_event_type = normalize_event_type(event_type)
-    if _contains_any(text, LIQUIDITY_TERMS) and normalized_event_type in {
-        "monetary_policy",
-        "financial_crisis",
-    }:
+    # The event-type gates are checked before the text scans they guard.
+    if normalized_event_type in LIQUIDITY_EVENT_TYPES and _contains_any(text, LIQUIDITY_TERMS):
         return normalize_crypto_transmission(
             {
                 "exists": True,
@@ -123,7 +132,7 @@ def evaluate_transmission(event_text: str | None, event_type: str | None) -> dic
             }
         )
 
-    if _contains_any(text, SANCTION_TERMS) and normalized_event_type == "geopolitical":
+    if normalized_event_type == "geopolitical" and _contains_any(text, SANCTION_TERMS):
         return normalize_crypto_transmission(
             {
                 "exists": True,
@@ -143,7 +152,7 @@ def evaluate_transmission(event_text: str | None, event_type: str | None) -> dic
             }
         )
 
-    return default_transmission()
+    return _DEFAULT_TRANSMISSION
 
 
 def _normalize_strength(value: object) -> str:
@@ -162,5 +171,10 @@ def _normalize_asset(value: str) -> str:
     return CRYPTO_ASSET_ALIASES.get(normalized, value.strip())
 
 
+def _dedupe(assets: Iterable[str]) -> list[str]:
+    # dict preserves first-seen order and dedupes in C
+    return list(dict.fromkeys(assets))
+
+
 def _contains_any(text: str, terms: Iterable[str]) -> bool:
     return any(term in text for term in terms)
@@ -32,6 +32,10 @@ class Settings:
     scheduler_prices_interval_minutes: int
     scheduler_digest_hour: int
     scheduler_digest_minute: int
+    # Vector search
+    hnsw_ef_search: int
+    # Macro event analysis
+    analysis_concurrency: int
 
 
 def _get_env(name: str, default: str) -> str:
@@ -119,4 +123,6 @@ def get_settings() -> Settings:
         ),
         scheduler_digest_hour=int(_get_env("MERIDIAN_SCHEDULER_DIGEST_HOUR", "6")),
         scheduler_digest_minute=int(_get_env("MERIDIAN_SCHEDULER_DIGEST_MINUTE", "0")),
+        hnsw_ef_search=int(_get_env("MERIDIAN_HNSW_EF_SEARCH", "100")),
+        analysis_concurrency=int(_get_env("MERIDIAN_ANALYSIS_CONCURRENCY", "4")),
     )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+import psycopg
+
+
+def copy_rows(
+    conn: psycopg.Connection,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> None:
+    """Stream rows into ``table`` with COPY FROM STDIN instead of per-row INSERTs."""
+    column_list = ", ".join(columns)
+    with conn.cursor() as cur, cur.copy(f"COPY {table} ({column_list}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row(row)
+
+
+def stage_rows(
+    conn: psycopg.Connection,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> str:
+    """COPY rows into a temp table shaped like ``table`` and return its name.
+
+    COPY cannot resolve conflicts, so upserts load a staging table first and then
+    run a single ``INSERT ... SELECT ... ON CONFLICT`` against the real table. The
+    staging table is dropped when the transaction commits.
+    """
+    staging = f"{table}_staging"
+    column_list = ", ".join(columns)
+    conn.execute(
+        f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {table} WITH NO DATA"
+    )
+    copy_rows(conn, staging, columns, rows)
+    return staging
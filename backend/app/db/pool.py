@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import atexit
+from functools import lru_cache
+
+from psycopg_pool import ConnectionPool
+
+from app.core.settings import get_settings, normalize_database_url
+
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 8
+
+
+@lru_cache
+def get_pool() -> ConnectionPool:
+    """Process-wide connection pool for short, frequent queries.
+
+    Connections run in autocommit mode: the helpers using the pool issue single
+    statements, so each one commits on its own without an extra BEGIN/COMMIT.
+    Use ``conn.transaction()`` where several statements must commit together.
+    """
+    pool = ConnectionPool(
+        normalize_database_url(get_settings().database_url),
+        min_size=POOL_MIN_SIZE,
+        max_size=POOL_MAX_SIZE,
+        kwargs={"autocommit": True},
+        open=True,
+    )
+    atexit.register(pool.close)
+    return pool
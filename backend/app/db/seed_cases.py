@@ -10,6 +10,7 @@ import psycopg
 from psycopg.types.json import Json
 
 from app.core.settings import get_settings, normalize_database_url
+from app.db.bulk import stage_rows
 from app.db.embeddings import format_embedding
 
 REQUIRED_FIELDS = {
@@ -194,6 +195,26 @@ def _validate_crypto_transmission(crypto_transmission: dict[str, Any], path: Pat
             raise ValueError(f"{path}: crypto_transmission.{key} must be a string")
 
 
+CASE_COLUMNS = (
+    "event_name",
+    "date_range",
+    "event_type",
+    "significance_score",
+    "structural_drivers",
+    "metal_impacts",
+    "traditional_market_reaction",
+    "crypto_reaction",
+    "crypto_transmission",
+    "time_delays",
+    "lessons",
+    "counter_examples",
+    "embedding",
+    "quantitative_impacts",
+    "time_horizon_behavior",
+    "transmission_channels",
+)
+
+
 def seed_cases(data_dir: Path) -> int:
     entries = load_case_entries(data_dir)
     if not entries:
@@ -201,102 +222,80 @@ def seed_cases(data_dir: Path) -> int:
 
     settings = get_settings()
     database_url = normalize_database_url(settings.database_url)
-    query = """
-        INSERT INTO historical_cases (
-            id,
-            event_name,
-            date_range,
-            event_type,
-            significance_score,
-            structural_drivers,
-            metal_impacts,
-            traditional_market_reaction,
-            crypto_reaction,
-            crypto_transmission,
-            time_delays,
-            lessons,
-            counter_examples,
-            embedding,
-            quantitative_impacts,
-            time_horizon_behavior,
-            transmission_channels
-        )
-        VALUES (
-            gen_random_uuid(),
-            %(event_name)s,
-            %(date_range)s,
-            %(event_type)s,
-            %(significance_score)s,
-            %(structural_drivers)s,
-            %(metal_impacts)s,
-            %(traditional_market_reaction)s,
-            %(crypto_reaction)s,
-            %(crypto_transmission)s,
-            %(time_delays)s,
-            %(lessons)s,
-            %(counter_examples)s,
-            %(embedding)s,
-            %(quantitative_impacts)s,
-            %(time_horizon_behavior)s,
-            %(transmission_channels)s
-        )
-        ON CONFLICT (event_name, date_range)
-        DO UPDATE SET
-            event_type = EXCLUDED.event_type,
-            significance_score = EXCLUDED.significance_score,
-            structural_drivers = EXCLUDED.structural_drivers,
-            metal_impacts = EXCLUDED.metal_impacts,
-            traditional_market_reaction = EXCLUDED.traditional_market_reaction,
-            crypto_reaction = EXCLUDED.crypto_reaction,
-            crypto_transmission = EXCLUDED.crypto_transmission,
-            time_delays = EXCLUDED.time_delays,
-            lessons = EXCLUDED.lessons,
-            counter_examples = EXCLUDED.counter_examples,
-            embedding = COALESCE(EXCLUDED.embedding, historical_cases.embedding),
-            quantitative_impacts = COALESCE(EXCLUDED.quantitative_impacts, historical_cases.quantitative_impacts),
-            time_horizon_behavior = COALESCE(EXCLUDED.time_horizon_behavior, historical_cases.time_horizon_behavior),
-            transmission_channels = COALESCE(EXCLUDED.transmission_channels, historical_cases.transmission_channels)
-    """
+    column_list = ", ".join(CASE_COLUMNS)
+
+    # One INSERT ... ON CONFLICT cannot update the same row twice, so an
+    # (event_name, date_range) repeated across files is collapsed first; the
+    # last file wins, as it did with per-row upserts.
+    latest = {(entry.event_name, entry.date_range): entry for entry in entries}
 
     with psycopg.connect(database_url) as conn:
-        for entry in entries:
-            embedding_value = None
-            if entry.embedding is not None:
-                embedding_value = format_embedding(entry.embedding)
-
-            quantitative_impacts_value = None
-            if entry.quantitative_impacts is not None:
-                quantitative_impacts_value = Json(entry.quantitative_impacts)
-
-            time_horizon_behavior_value = None
-            if entry.time_horizon_behavior is not None:
-                time_horizon_behavior_value = Json(entry.time_horizon_behavior)
-
-            conn.execute(
-                query,
-                {
-                    "event_name": entry.event_name,
-                    "date_range": entry.date_range,
-                    "event_type": entry.event_type,
-                    "significance_score": entry.significance_score,
-                    "structural_drivers": entry.structural_drivers,
-                    "metal_impacts": Json(entry.metal_impacts),
-                    "traditional_market_reaction": entry.traditional_market_reaction,
-                    "crypto_reaction": entry.crypto_reaction,
-                    "crypto_transmission": Json(entry.crypto_transmission),
-                    "time_delays": entry.time_delays,
-                    "lessons": entry.lessons,
-                    "counter_examples": entry.counter_examples,
-                    "embedding": embedding_value,
-                    "quantitative_impacts": quantitative_impacts_value,
-                    "time_horizon_behavior": time_horizon_behavior_value,
-                    "transmission_channels": entry.transmission_channels,
-                },
-            )
+        staging = stage_rows(
+            conn,
+            "historical_cases",
+            CASE_COLUMNS,
+            (_case_row(entry) for entry in latest.values()),
+        )
+        conn.execute(
+            f"""
+            INSERT INTO historical_cases (id, {column_list})
+            SELECT gen_random_uuid(), {column_list}
+            FROM {staging}
+            ON CONFLICT (event_name, date_range)
+            DO UPDATE SET
+                event_type = EXCLUDED.event_type,
+                significance_score = EXCLUDED.significance_score,
+                structural_drivers = EXCLUDED.structural_drivers,
+                metal_impacts = EXCLUDED.metal_impacts,
+                traditional_market_reaction = EXCLUDED.traditional_market_reaction,
+                crypto_reaction = EXCLUDED.crypto_reaction,
+                crypto_transmission = EXCLUDED.crypto_transmission,
+                time_delays = EXCLUDED.time_delays,
+                lessons = EXCLUDED.lessons,
+                counter_examples = EXCLUDED.counter_examples,
+                embedding = COALESCE(EXCLUDED.embedding, historical_cases.embedding),
+                quantitative_impacts = COALESCE(EXCLUDED.quantitative_impacts, historical_cases.quantitative_impacts),
+                time_horizon_behavior = COALESCE(EXCLUDED.time_horizon_behavior, historical_cases.time_horizon_behavior),
+                transmission_channels = COALESCE(EXCLUDED.transmission_channels, historical_cases.transmission_channels)
+            """
+        )
 
     return len(entries)
 
 
+def _case_row(entry: HistoricalCaseEntry) -> tuple[Any, ...]:
+    embedding_value = None
+    if entry.embedding is not None:
+        embedding_value = format_embedding(entry.embedding)
+
+    quantitative_impacts_value = None
+    if entry.quantitative_impacts is not None:
+        quantitative_impacts_value = Json(entry.quantitative_impacts)
+
+    time_horizon_behavior_value = None
+    if entry.time_horizon_behavior is not None:
+        time_horizon_behavior_value = Json(entry.time_horizon_behavior)
+
+    return (
+        entry.event_name,
+        entry.date_range,
+        entry.event_type,
+        entry.significance_score,
+        entry.structural_drivers,
+        Json(entry.metal_impacts),
+        entry.traditional_market_reaction,
+        entry.crypto_reaction,
+        Json(entry.crypto_transmission),
+        entry.time_delays,
+        entry.lessons,
+        entry.counter_examples,
+        embedding_value,
+        quantitative_impacts_value,
+        time_horizon_behavior_value,
+        entry.transmission_channels,
+    )
+
+
 def _default_seed_dir() -> Path:
     return Path(__file__).resolve().parents[3] / "data" / "cases"
 
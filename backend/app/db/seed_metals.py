@@ -10,6 +10,7 @@ import psycopg
 from psycopg.types.json import Json
 
 from app.core.settings import get_settings, normalize_database_url
+from app.db.bulk import stage_rows
 
 ALLOWED_METALS = {"gold", "silver", "copper"}
 ALLOWED_CATEGORIES = {"supply_chain", "use_cases", "patterns", "correlations", "actors"}
@@ -76,23 +77,29 @@ def seed_metals(data_dir: Path) -> int:
 
     settings = get_settings()
     database_url = normalize_database_url(settings.database_url)
-    query = """
-        INSERT INTO metals_knowledge (id, metal, category, content, updated_at)
-        VALUES (gen_random_uuid(), %(metal)s, %(category)s, %(content)s, now())
-        ON CONFLICT (metal, category)
-        DO UPDATE SET content = EXCLUDED.content, updated_at = now()
-    """
+    columns = ("metal", "category", "content")
+
+    # One INSERT ... ON CONFLICT cannot update the same row twice, so a
+    # (metal, category) repeated across files is collapsed first; the last file
+    # wins, as it did with per-row upserts.
+    latest = {(entry.metal, entry.category): entry for entry in entries}
 
     with psycopg.connect(database_url) as conn:
-        for entry in entries:
-            conn.execute(
-                query,
-                {
-                    "metal": entry.metal,
-                    "category": entry.category,
-                    "content": Json(entry.content),
-                },
-            )
+        staging = stage_rows(
+            conn,
+            "metals_knowledge",
+            columns,
+            ((entry.metal, entry.category, Json(entry.content)) for entry in latest.values()),
+        )
+        conn.execute(
+            f"""
+            INSERT INTO metals_knowledge (id, metal, category, content, updated_at)
+            SELECT gen_random_uuid(), metal, category, content, now()
+            FROM {staging}
+            ON CONFLICT (metal, category)
+            DO UPDATE SET content = EXCLUDED.content, updated_at = now()
+            """
+        )
 
     return len(entries)
 
@@ -678,7 +678,7 @@ def upsert_events(events: Iterable[EconomicCalendarEvent]) -> int:
             surprise_magnitude
         )
         VALUES (
-            gen_random_uuid(),
+            uuidv7(),
             %(event_name)s,
             %(event_date)s,
             %(region)s,
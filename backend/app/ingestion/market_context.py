@@ -242,37 +242,51 @@ def fetch_market_snapshot(snapshot_date: date | None = None) -> MarketSnapshot:
     return snapshot
 
 
-def extract_key_levels(snapshot: MarketSnapshot) -> dict[str, float | None]:
-    """
-    Extract key levels from snapshot for the market_context table.
-
-    Returns dict with keys matching the DB columns:
-    - vix_level, dxy_level, us10y_level, us2y_level
-    - gold_level, oil_level, spx_level, btc_level
-    - spread_2s10s, hy_spread
-    """
+@dataclass(frozen=True, slots=True)
+class KeyLevels:
+    """Key levels extracted from a snapshot; fields match the market_context columns."""
+
+    vix_level: float | None
+    dxy_level: float | None
+    us10y_level: float | None  # Yahoo (x10)
+    us2y_level: float | None  # FRED
+    gold_level: float | None
+    oil_level: float | None
+    spx_level: float | None
+    btc_level: float | None
+    spread_2s10s: float | None
+    hy_spread: float | None
+    # Ratios
+    gold_silver_ratio: float | None
+    copper_gold_ratio: float | None
+    vix_term_structure: float | None
+    spy_rsp_ratio: float | None
+
+
+def extract_key_levels(snapshot: MarketSnapshot) -> KeyLevels:
+    """Extract key levels from snapshot for the market_context table."""
 
     def to_float(value: Decimal | None) -> float | None:
         return float(value) if value is not None else None
 
+    ratios = snapshot.calculated_ratios
     # Direct mappings from symbols to column names
-    return {
-        "vix_level": to_float(snapshot.get_value("^VIX")),
-        "dxy_level": to_float(snapshot.get_value("DX=F")),
-        "us10y_level": to_float(snapshot.get_value("^TNX")),  # Yahoo (x10)
-        "us2y_level": to_float(snapshot.get_value("DGS2")),  # FRED
-        "gold_level": to_float(snapshot.get_value("GC=F")),
-        "oil_level": to_float(snapshot.get_value("CL=F")),
-        "spx_level": to_float(snapshot.get_value("^GSPC")),
-        "btc_level": to_float(snapshot.get_value("BTC-USD")),
-        "spread_2s10s": to_float(snapshot.get_value("T10Y2Y")),
-        "hy_spread": to_float(snapshot.get_value("BAMLH0A0HYM2")),
-        # Ratios
-        "gold_silver_ratio": to_float(snapshot.calculated_ratios.get("gold_silver_ratio")),
-        "copper_gold_ratio": to_float(snapshot.calculated_ratios.get("copper_gold_ratio")),
-        "vix_term_structure": to_float(snapshot.calculated_ratios.get("vix_term_structure")),
-        "spy_rsp_ratio": to_float(snapshot.calculated_ratios.get("spy_rsp_ratio")),
-    }
+    return KeyLevels(
+        vix_level=to_float(snapshot.get_value("^VIX")),
+        dxy_level=to_float(snapshot.get_value("DX=F")),
+        us10y_level=to_float(snapshot.get_value("^TNX")),
+        us2y_level=to_float(snapshot.get_value("DGS2")),
+        gold_level=to_float(snapshot.get_value("GC=F")),
+        oil_level=to_float(snapshot.get_value("CL=F")),
+        spx_level=to_float(snapshot.get_value("^GSPC")),
+        btc_level=to_float(snapshot.get_value("BTC-USD")),
+        spread_2s10s=to_float(snapshot.get_value("T10Y2Y")),
+        hy_spread=to_float(snapshot.get_value("BAMLH0A0HYM2")),
+        gold_silver_ratio=to_float(ratios.get("gold_silver_ratio")),
+        copper_gold_ratio=to_float(ratios.get("copper_gold_ratio")),
+        vix_term_structure=to_float(ratios.get("vix_term_structure")),
+        spy_rsp_ratio=to_float(ratios.get("spy_rsp_ratio")),
+    )
 
 
 def snapshot_to_raw_json(snapshot: MarketSnapshot) -> tuple[dict[str, Any], dict[str, Any]]:
@@ -19,7 +19,6 @@ import time
 
 from app.analysis.market_context import (
     build_market_context_record,
-    classify_regimes,
     format_context_for_llm,
     upsert_market_context,
 )
@@ -61,16 +60,13 @@ def run_once(dry_run: bool = False, verbose: bool = False) -> bool:
             if len(snapshot.errors) > 10:
                 print(f"  ... and {len(snapshot.errors) - 10} more")
 
-    # Classify regimes
-    regimes = classify_regimes(snapshot)
+    # Classify regimes and build the record
+    record = build_market_context_record(snapshot)
     print(
-        f"\nRegimes: volatility={regimes.volatility_regime}, "
-        f"dollar={regimes.dollar_regime}, curve={regimes.curve_regime}, "
-        f"credit={regimes.credit_regime}"
+        f"\nRegimes: volatility={record.volatility_regime}, "
+        f"dollar={record.dollar_regime}, curve={record.curve_regime}, "
+        f"credit={record.credit_regime}"
     )
-
-    # Build record
-    record = build_market_context_record(snapshot, regimes)
     print(f"Position sizing multiplier: {record.suggested_size_multiplier:.0%}")
 
     if verbose:
@@ -187,7 +187,7 @@ def insert_prices(bars: Iterable[PriceBar], source: str = DEFAULT_SOURCE) -> int
             created_at
         )
         VALUES (
-            gen_random_uuid(),
+            uuidv7(),
             %(symbol)s,
             %(price_date)s,
             %(open)s,
@@ -197,7 +197,7 @@ def insert_prices(bars: Iterable[PriceBar], source: str = DEFAULT_SOURCE) -> int
             %(adj_close)s,
             %(volume)s,
             %(source)s,
-            now()
+            timezone('utc', now())
         )
         ON CONFLICT (symbol, price_date)
         DO UPDATE SET
@@ -244,13 +244,13 @@ def insert_price_ratios(entries: Iterable[RatioEntry]) -> int:
             created_at
         )
         VALUES (
-            gen_random_uuid(),
+            uuidv7(),
             %(ratio_name)s,
             %(price_date)s,
             %(value)s,
             %(base_symbol)s,
             %(quote_symbol)s,
-            now()
+            timezone('utc', now())
         )
         ON CONFLICT (ratio_name, price_date)
         DO UPDATE SET
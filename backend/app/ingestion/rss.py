@@ -109,7 +109,7 @@ def insert_events(entries: Iterable[RssEntry]) -> int:
             status
         )
         VALUES (
-            gen_random_uuid(),
+            uuidv7(),
             now(),
             %(source)s,
             %(headline)s,
@@ -117,7 +117,7 @@ def insert_events(entries: Iterable[RssEntry]) -> int:
             %(published_at)s,
             'new'
         )
-        ON CONFLICT (source, headline, published_at) DO NOTHING
+        ON CONFLICT (source, headline_sha, published_at) DO NOTHING
     """
 
     inserted = 0
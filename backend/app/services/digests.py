@@ -359,7 +359,7 @@ def fetch_metals_snapshot(conn: psycopg.Connection, as_of_date: date) -> dict[st
     query = """
         SELECT symbol,
                price_date,
-               close,
+               close::numeric,
                rn
         FROM (
             SELECT symbol,
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import contextlib
+from typing import Iterator, Self
+
+import pytest
+
+
+class FakeConnection:
+    """In-memory stand-in for a psycopg pool, connection, cursor and COPY.
+
+    Every role returns the same object, so a test can patch ``get_pool`` or
+    ``psycopg.connect`` with it and inspect what was executed afterwards.
+    """
+
+    def __init__(self) -> None:
+        self.result: list[tuple[object, ...]] = []
+        self.queries: list[str] = []
+        self.params: list[object] = []
+        self.copied: list[tuple[object, ...]] = []
+        self.cursor_names: list[str | None] = []
+        self.row_factories: list[object] = []
+        self.itersize: int | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def __iter__(self) -> Iterator[tuple[object, ...]]:
+        return iter(self.result)
+
+    def connection(self) -> Self:
+        return self
+
+    def transaction(self) -> contextlib.nullcontext[None]:
+        return contextlib.nullcontext()
+
+    def cursor(self, name: str | None = None, *, row_factory: object = None) -> Self:
+        self.cursor_names.append(name)
+        self.row_factories.append(row_factory)
+        return self
+
+    def execute(self, query: str, params: object = None) -> Self:
+        self.queries.append(" ".join(query.split()))
+        self.params.append(params)
+        return self
+
+    def fetchone(self) -> tuple[object, ...] | None:
+        return self.result[0] if self.result else None
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self.result
+
+    def copy(self, statement: str) -> Self:
+        self.queries.append(statement)
+        return self
+
+    def write_row(self, row: tuple[object, ...]) -> None:
+        self.copied.append(tuple(row))
+
+
+@pytest.fixture
+def fake_db() -> FakeConnection:
+    return FakeConnection()
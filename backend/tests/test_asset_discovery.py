@@ -0,0 +1,189 @@
+"""Tests for app.analysis.asset_discovery module."""
+
+from app.analysis.asset_discovery import (
+    DiscoveryResult,
+    _expand_channels,
+    discover_assets_by_channel_type,
+    discover_assets_for_event,
+    extract_tickers_from_text,
+    format_discovery_for_prompt,
+    merge_discovery_results,
+    validate_tickers,
+)
+from app.analysis.transmission_channels import ChannelType, TransmissionChannel
+
+
+class TestValidateTickers:
+    """Tests for validate_tickers format checks."""
+
+    def test_accepts_plain_tickers_and_uppercases(self) -> None:
+        assert validate_tickers(["AAPL", "spy", "X"]) == ["AAPL", "SPY", "X"]
+
+    def test_accepts_dotted_share_classes(self) -> None:
+        assert validate_tickers(["BRK.B", "brk.a"]) == ["BRK.B", "BRK.A"]
+
+    def test_accepts_futures_and_forex_suffixes(self) -> None:
+        assert validate_tickers(["GC=F", "EURUSD=X"]) == ["GC=F", "EURUSD=X"]
+
+    def test_rejects_non_tickers_and_bad_formats(self) -> None:
+        assert validate_tickers(["", "THE", "FOMC", "TOOLONG", "AB.CD", "CL=Z", "A1"]) == []
+
+    def test_uppercases_futures_symbols(self) -> None:
+        assert validate_tickers(["gc=f", "TOOLONGX=X"]) == ["GC=F"]
+
+
+class TestExtractTickersFromText:
+    """Tests for extract_tickers_from_text."""
+
+    def test_extracts_tickers_and_futures_in_order(self) -> None:
+        text = "GLD and GC=F rallied while the FED held; GLD volume spiked in CL=F too"
+        assert extract_tickers_from_text(text) == ["GLD", "GC=F", "CL=F"]
+
+    def test_skips_single_letters_and_unknown_suffixes(self) -> None:
+        assert extract_tickers_from_text("A rally in X and ZZ=Q or AAPL=Q") == []
+
+    def test_keeps_single_letter_futures(self) -> None:
+        assert extract_tickers_from_text("X=F and GC=F") == ["X=F", "GC=F"]
+
+
+class TestMergeDiscoveryResults:
+    """Tests for merge_discovery_results and DiscoveryResult.all_assets."""
+
+    def test_assets_keep_highest_priority_bucket(self) -> None:
+        first = DiscoveryResult(
+            primary_assets=["GC=F"],
+            secondary_assets=["SLV", "GDX"],
+            search_queries_used=["gold"],
+            errors=["a"],
+        )
+        second = DiscoveryResult(
+            primary_assets=["SLV", "GC=F"],
+            discovered_assets=["GDX", "NEM"],
+            search_queries_used=["gold", "silver"],
+            errors=["b"],
+        )
+
+        merged = merge_discovery_results(first, second)
+
+        assert merged.primary_assets == ["GC=F", "SLV"]
+        assert merged.secondary_assets == ["GDX"]
+        assert merged.discovered_assets == ["NEM"]
+        assert merged.search_queries_used == ["gold", "silver"]
+        assert merged.errors == ["a", "b"]
+        assert merged.all_assets() == ["GC=F", "SLV", "GDX", "NEM"]
+
+
+class TestDiscoverAssetsByChannelType:
+    """Tests for discover_assets_by_channel_type."""
+
+    def test_known_channel_populates_assets(self) -> None:
+        result = discover_assets_by_channel_type("oil_supply_disruption")
+
+        assert [c.channel_type.value for c in result.channels] == ["oil_supply_disruption"]
+        assert result.primary_assets
+        assert result.search_queries_used
+        assert result.errors == []
+
+    def test_unknown_channel_records_error(self) -> None:
+        result = discover_assets_by_channel_type("not_a_channel")
+
+        assert result.channels == []
+        assert result.errors == ["Unknown channel type: not_a_channel"]
+
+
+class TestDiscoverAssetsForEvent:
+    """Tests for discover_assets_for_event."""
+
+    def test_assets_are_unique_across_buckets(self) -> None:
+        result = discover_assets_for_event(
+            headline="Sanctions threaten oil pipeline as investors flee to safety",
+            event_type="geopolitical",
+        )
+
+        assert result.channels
+        assert len(result.primary_assets) == len(set(result.primary_assets))
+        assert len(result.secondary_assets) == len(set(result.secondary_assets))
+        assert not set(result.primary_assets) & set(result.secondary_assets)
+        assert len(result.search_queries_used) == len(set(result.search_queries_used))
+
+    def test_repeat_calls_return_independent_results(self) -> None:
+        first = discover_assets_for_event("Oil pipeline attack", "geopolitical")
+        first.primary_assets.append("MUTATED")
+        first.channels.clear()
+
+        second = discover_assets_for_event("Oil pipeline attack", "geopolitical")
+
+        assert second.channels
+        assert "MUTATED" not in second.primary_assets
+
+    def test_keyword_scan_is_shared_across_event_types(self) -> None:
+        headline = "OPEC cuts output while the dollar rallies"
+        geo = discover_assets_for_event(headline, "geopolitical")
+        monetary = discover_assets_for_event(headline, "monetary_policy")
+
+        keyword_only = discover_assets_for_event(headline)
+        n = len(keyword_only.channels)
+        assert keyword_only.channels
+        assert geo.channels[:n] == monetary.channels[:n] == keyword_only.channels
+
+    def test_search_queries_are_deduplicated(self) -> None:
+        channels = [
+            TransmissionChannel(
+                channel_type=ChannelType.FED_HAWKISH,
+                name="Hawkish",
+                description="",
+                primary_assets=("DX-Y.NYB",),
+                search_queries=("fed rate path", "dollar outlook"),
+            ),
+            TransmissionChannel(
+                channel_type=ChannelType.DOLLAR_STRENGTH,
+                name="Dollar",
+                description="",
+                primary_assets=("UUP",),
+                search_queries=("dollar outlook", "dxy breakout"),
+            ),
+        ]
+
+        result = _expand_channels(channels, include_secondary=True)
+
+        assert result.search_queries_used == ["fed rate path", "dollar outlook", "dxy breakout"]
+
+    def test_include_secondary_false_skips_secondary(self) -> None:
+        result = discover_assets_for_event(
+            headline="Oil pipeline attack", event_type="geopolitical", include_secondary=False
+        )
+
+        assert result.primary_assets
+        assert result.secondary_assets == []
+
+
+def test_format_discovery_for_prompt_skips_empty_sections() -> None:
+    result = DiscoveryResult(primary_assets=["GC=F", "SLV"], discovered_assets=["NEM"])
+
+    assert format_discovery_for_prompt(result) == "\n".join(
+        [
+            "=== DISCOVERED ASSETS ===",
+            "",
+            "PRIMARY ASSETS (high relevance):",
+            "  GC=F, SLV",
+            "",
+            "ADDITIONAL DISCOVERED:",
+            "  NEM",
+            "",
+            "=" * 25,
+        ]
+    )
+
+
+def test_format_discovery_for_prompt_trims_channel_descriptions() -> None:
+    result = discover_assets_by_channel_type("oil_supply_disruption")
+    channel = result.channels[0]
+
+    lines = format_discovery_for_prompt(result).split("\n")
+
+    assert lines[1:5] == [
+        "",
+        "TRANSMISSION CHANNELS:",
+        f"  • {channel.name}",
+        f"    {channel.description[:100]}...",
+    ]
@@ -0,0 +1,147 @@
+"""Tests for app.analysis.conviction module."""
+
+import dataclasses
+
+import pytest
+
+from app.analysis.conviction import (
+    ConvictionComponent,
+    ConvictionLevel,
+    _classify_conviction_level,
+    _score_channel_clarity,
+    _score_counter_case,
+    _score_historical_precedent,
+    _score_quantitative_magnitude,
+    _score_timing_catalyst,
+    calculate_conviction_score,
+    format_conviction_for_prompt,
+)
+
+
+def test_component_weighted_score_is_capped_at_construction() -> None:
+    assert ConvictionComponent("x", raw_score=30, max_score=25).weighted_score == 25
+    assert ConvictionComponent("x", raw_score=10, max_score=15, weight=-1.0).weighted_score == -10
+
+
+def test_component_is_frozen_so_weighted_score_cannot_go_stale() -> None:
+    component = ConvictionComponent("x", raw_score=10, max_score=25)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        component.raw_score = 30  # type: ignore[misc]
+
+
+class TestClassifyConvictionLevel:
+    """Tests for threshold classification."""
+
+    @pytest.mark.parametrize(
+        ("score", "level"),
+        [
+            (0, ConvictionLevel.INSUFFICIENT),
+            (29.9, ConvictionLevel.INSUFFICIENT),
+            (30, ConvictionLevel.LOW),
+            (49.9, ConvictionLevel.LOW),
+            (50, ConvictionLevel.MEDIUM),
+            (69.9, ConvictionLevel.MEDIUM),
+            (70, ConvictionLevel.HIGH),
+            (100, ConvictionLevel.HIGH),
+        ],
+    )
+    def test_threshold_boundaries(self, score: float, level: ConvictionLevel) -> None:
+        assert _classify_conviction_level(score) == level
+
+
+class TestCountLadders:
+    """Tests for case/channel count scoring."""
+
+    @pytest.mark.parametrize(("count", "expected"), [(0, 0), (1, 10), (2, 15), (3, 20), (7, 20)])
+    def test_channel_clarity_by_count(self, count: int, expected: int) -> None:
+        assert _score_channel_clarity(["oil"] * count).raw_score == expected
+
+    def test_historical_bonus_for_high_significance(self) -> None:
+        cases = [{"significance_score": 90}, {"significance_score": 85}]
+        component = _score_historical_precedent(cases)
+        assert component.raw_score == 20
+        assert component.rationale == "2 case(s) matched, avg significance 88"
+
+    def test_historical_average_ignores_unscored_cases(self) -> None:
+        cases = [{"significance_score": 90}, {"significance_score": None}, {}]
+        component = _score_historical_precedent(cases)
+        assert component.raw_score == 25
+        assert component.rationale == "3 case(s) matched, avg significance 90"
+
+
+class TestQuantitativeMagnitude:
+    """Tests for quantitative impact ladders."""
+
+    def test_band_edges_and_rationale(self) -> None:
+        component = _score_quantitative_magnitude(
+            {"production_drop_pct": 90, "price_impact_pct": 50, "global_supply_impact_pct": 2}
+        )
+        assert component.raw_score == 20
+        assert component.rationale == (
+            "production drop 90% (severe); price impact 50% (major); global supply 2%"
+        )
+
+    def test_small_values_score_minor_bands(self) -> None:
+        component = _score_quantitative_magnitude(
+            {"production_drop_pct": 5, "peak_price_impact_pct": 1, "global_supply_impact_pct": 1}
+        )
+        assert component.raw_score == 5
+        assert component.rationale == "production drop 5% (minor); price impact 1% (minor)"
+
+    def test_zero_values_score_nothing(self) -> None:
+        component = _score_quantitative_magnitude({"production_drop_pct": 0})
+        assert component.raw_score == 0
+        assert component.rationale == "Minimal quantitative impact"
+
+
+class TestLabelTables:
+    """Tests for catalyst/counter-case label scoring."""
+
+    @pytest.mark.parametrize(
+        ("clarity", "expected"), [("HIGH", 15), ("medium", 10), ("Low", 5), ("unclear", 0)]
+    )
+    def test_timing_catalyst(self, clarity: str, expected: int) -> None:
+        assert _score_timing_catalyst(clarity).raw_score == expected
+
+    @pytest.mark.parametrize(
+        ("strength", "expected"), [("Strong", -15), ("moderate", -10), ("weak", -5), ("?", 0)]
+    )
+    def test_counter_case_is_a_discount(self, strength: str, expected: int) -> None:
+        assert _score_counter_case(strength).weighted_score == expected
+
+
+def test_calculate_conviction_score_sums_components() -> None:
+    result = calculate_conviction_score(
+        historical_cases=[{"significance_score": 90}, {"significance_score": 85}],
+        quantitative_impacts={"production_drop_pct": 50, "price_impact_pct": 30},
+        matched_channels=["oil_supply_disruption", "sanctions_trade_war"],
+        catalyst_clarity="high",
+        counter_case_strength="weak",
+    )
+
+    # 20 + 11 + 15 + 15 - 5
+    assert result.total_score == 56
+    assert result.level == ConvictionLevel.MEDIUM
+    assert result.to_dict()["components"][4]["score"] == -5
+
+
+def test_format_conviction_for_prompt_layout() -> None:
+    text = format_conviction_for_prompt(calculate_conviction_score())
+    lines = text.split("\n")
+
+    assert lines[:5] == [
+        "=== CONVICTION ASSESSMENT ===",
+        "",
+        "OVERALL: INSUFFICIENT (0/100)",
+        "",
+        "COMPONENT BREAKDOWN:",
+    ]
+    assert "  Counter-Case Discount: -10 pts" in lines
+    assert lines[-5:] == [
+        "WARNINGS:",
+        "  ⚠ Limited historical precedent data",
+        "  ⚠ Limited quantitative impact data",
+        "",
+        "=" * 27,
+    ]
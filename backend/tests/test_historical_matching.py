@@ -1,69 +1,66 @@
 from __future__ import annotations
 
-from app.analysis.historical import HistoricalCase, extract_keywords, rank_cases
-
-
-def test_extract_keywords_filters_stopwords_and_short_tokens() -> None:
-    keywords = extract_keywords("The Fed hikes rates in the US and in Europe")
-
-    assert "fed" in keywords
-    assert "hikes" in keywords
-    assert "rates" in keywords
-    assert "the" not in keywords
-    assert "us" not in keywords
-
-
-def test_rank_cases_prefers_event_type_and_keywords() -> None:
-    cases = [
-        HistoricalCase(
-            event_name="Fed Hiking Cycle",
-            date_range="2022-2023",
-            event_type="monetary_policy",
-            significance_score=80,
-            structural_drivers=["Rate hikes", "tightening"],
-            lessons=["liquidity stress"],
-            counter_examples=[],
-            traditional_market_reaction=[],
-        ),
-        HistoricalCase(
-            event_name="SVB Banking Crisis",
-            date_range="2023",
-            event_type="financial_crisis",
-            significance_score=90,
-            structural_drivers=["bank run", "liquidity"],
-            lessons=["liquidity stress"],
-            counter_examples=[],
-            traditional_market_reaction=[],
-        ),
-    ]
+from app.analysis import historical
+from app.analysis.historical import fallback_matches, find_similar_cases
+
+
+def test_fallback_matches_ranks_in_database(monkeypatch, fake_db) -> None:
+    conn = fake_db
+    conn.result = [("Fed Hiking Cycle", "2022-2023", "monetary", 80, 5.2)]
+
+    monkeypatch.setattr(historical, "get_pool", lambda: conn)
 
-    matches = rank_cases(
-        cases,
-        event_text="Fed hikes spark liquidity stress",
-        event_type="monetary_policy",
-        limit=2,
-    )
+    matches = fallback_matches(event_text="Fed hikes", event_type="Central Bank", limit=3)
 
+    params = conn.params[0]
+    assert params["event_text"] == "Fed hikes"
+    assert params["limit"] == 3
+    assert set(params["event_types"]) == {
+        "monetary_policy",
+        "monetary",
+        "central_bank",
+        "rate_decision",
+    }
     assert matches[0].event_name == "Fed Hiking Cycle"
     assert matches[0].match_method == "fallback"
+    assert matches[0].match_score == 5.2
+    assert "WHERE search_vector @@ keywords OR" in conn.queries[0]
+
+
+def test_fallback_matches_without_context_orders_every_case(monkeypatch, fake_db) -> None:
+    conn = fake_db
+    conn.result = []
+
+    monkeypatch.setattr(historical, "get_pool", lambda: conn)
 
+    fallback_matches(limit=3)
 
-def test_rank_cases_orders_by_significance_when_no_context() -> None:
-    cases = [
-        HistoricalCase(
-            event_name="Lower Impact",
-            date_range="2010",
-            event_type=None,
-            significance_score=40,
-        ),
-        HistoricalCase(
-            event_name="Higher Impact",
-            date_range="2020",
-            event_type=None,
-            significance_score=80,
-        ),
+    assert "WHERE" not in conn.queries[0]
+
+
+def test_find_similar_cases_skips_unembedded_rows(monkeypatch, fake_db) -> None:
+    conn = fake_db
+    conn.result = [
+        ("Fed Hiking Cycle", "2022-2023", "monetary_policy", 80, 0.25),
+        ("No Vector", None, None, 10, None),
     ]
 
-    matches = rank_cases(cases, event_text=None, event_type=None, limit=2)
+    monkeypatch.setattr(historical, "get_pool", lambda: conn)
+
+    matches = find_similar_cases([0.0] * 1536, limit=2)
+
+    assert [match.event_name for match in matches] == ["Fed Hiking Cycle"]
+    assert matches[0].distance == 0.25
+
+
+def test_fallback_matches_ors_keywords_so_one_shared_term_matches(monkeypatch, fake_db) -> None:
+    # The case shares only "tariffs" with the headline and has no type boost.
+    fake_db.result = [("Smoot-Hawley Tariff Act", "1930", "trade_war", 60, 0.1)]
+    monkeypatch.setattr(historical, "get_pool", lambda: fake_db)
+
+    matches = fallback_matches(event_text="White House announces sweeping tariffs", limit=3)
 
-    assert [match.event_name for match in matches] == ["Higher Impact", "Lower Impact"]
+    query = fake_db.queries[0]
+    assert "replace(plainto_tsquery('english', %(event_text)s)::text, ' & ', ' | ')" in query
+    assert "WHERE search_vector @@ keywords" in query
+    assert [match.event_name for match in matches] == ["Smoot-Hawley Tariff Act"]
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import copy
+import dataclasses
 from datetime import datetime, timezone
 import json
+import threading
 import uuid
 
+import httpx
+import pytest
+
+from app.analysis import macro_event_analysis
 from app.analysis.macro_event_analysis import (
     AnalysisRequest,
     HistoricalCaseSummary,
     LocalHeuristicProvider,
     MacroEventRecord,
     MetalsKnowledgeEntry,
+    OpenRouterProvider,
+    analyze_event,
     build_prompt,
+    fetch_event_by_id,
+    fetch_historical_cases,
+    fetch_historical_cases_by_types,
+    fetch_metals_knowledge,
+    fetch_priority_events,
     parse_analysis_response,
+    run_analysis,
 )
 from app.analysis.asset_discovery import DiscoveryResult
 from app.analysis.transmission_channels import ALL_CHANNELS
@@ -79,6 +94,32 @@ def test_parse_analysis_response_normalizes_payload() -> None:
     assert analysis.crypto_transmission["relevant_assets"] == ["BTC", "ETH"]
 
 
+def test_parse_analysis_response_drops_unknown_metal_fields() -> None:
+    payload = {
+        "raw_facts": ["  Spaced   fact ", ""],
+        "metal_impacts": {
+            "gold": {"direction": "up", "confidence": "high"},
+            "platinum": {"direction": "up"},
+            "silver": "n/a",
+        },
+        "historical_precedent": "insufficient data",
+        "counter_case": "insufficient data",
+        "crypto_transmission": {"exists": False},
+        "thesis_seed": "Wait.",
+    }
+
+    analysis = parse_analysis_response(json.dumps(payload))
+
+    assert analysis.raw_facts == ["Spaced fact"]
+    assert set(analysis.metal_impacts) == {"gold", "silver", "copper"}
+    assert analysis.metal_impacts["gold"] == {
+        "direction": "up",
+        "magnitude": "unknown",
+        "driver": "insufficient data",
+    }
+    assert analysis.metal_impacts["silver"]["direction"] == "unknown"
+
+
 def test_local_provider_returns_parsable_output() -> None:
     provider = LocalHeuristicProvider()
     prompt = 'EVENT_JSON:\n{ "headline": "Fed holds rates" }\n'
@@ -88,6 +129,22 @@ def test_local_provider_returns_parsable_output() -> None:
     assert analysis.raw_facts[0] == "Fed holds rates"
 
 
+def test_analyze_event_takes_local_payload_without_json(monkeypatch) -> None:
+    class _NoStringProvider(LocalHeuristicProvider):
+        def complete(self, prompt: str) -> str:
+            raise AssertionError("local analysis should not round-trip through JSON")
+
+    def no_block_parsing(prompt: str, label: str) -> None:
+        raise AssertionError("local analysis should not re-parse the prompt")
+
+    monkeypatch.setattr(macro_event_analysis, "_extract_json_block", no_block_parsing)
+    request = AnalysisRequest(_event("monetary_policy"), [], [])
+
+    analysis, _prompt = analyze_event(_NoStringProvider(), request)
+
+    assert analysis.raw_facts[0] == "monetary_policy headline"
+
+
 def test_build_prompt_includes_discovered_assets_section() -> None:
     """Test that discovered assets section is included in prompt when provided."""
     event_id = uuid.uuid4()
@@ -204,3 +261,217 @@ def test_parse_analysis_response_preserves_discovery_result() -> None:
     assert analysis.discovery_result is discovery
     assert analysis.discovery_result.primary_assets == ["CL=F", "BZ=F"]
     assert len(analysis.discovery_result.channels) == 1
+
+
+def _event(event_type: str | None) -> MacroEventRecord:
+    return MacroEventRecord(
+        id=uuid.uuid4(),
+        source="reuters",
+        headline=f"{event_type} headline",
+        full_text=None,
+        published_at=None,
+        event_type=event_type,
+        regions=None,
+        entities=None,
+        significance_score=None,
+    )
+
+
+def _case_row(bucket: str | None, name: str, event_type: str | None) -> tuple[object, ...]:
+    return (bucket, 1, uuid.uuid4(), name, "2020", event_type, 80, *([None] * 7))
+
+
+def test_fetch_historical_cases_by_types_groups_rows_in_one_query(monkeypatch, fake_db) -> None:
+    conn = fake_db
+    conn.result = [
+        _case_row(None, "Top overall", "pandemic"),
+        _case_row("monetary_policy", "Fed pause", "monetary_policy"),
+    ]
+    monkeypatch.setattr(macro_event_analysis, "get_pool", lambda: conn)
+
+    by_type = fetch_historical_cases_by_types({"monetary_policy", "election", None})
+
+    assert conn.params == [
+        {"types": ["election", "monetary_policy"], "include_untyped": True, "limit": 5}
+    ]
+    assert [case.event_name for case in by_type["monetary_policy"]] == ["Fed pause"]
+    assert by_type["election"] == []
+    assert [case.event_name for case in by_type[None]] == ["Top overall"]
+
+
+@pytest.mark.parametrize(
+    ("fetch", "record_type"),
+    [
+        (lambda: fetch_priority_events(limit=1), MacroEventRecord),
+        (lambda: fetch_event_by_id(uuid.uuid4()), MacroEventRecord),
+        (fetch_metals_knowledge, MetalsKnowledgeEntry),
+        (lambda: fetch_historical_cases("monetary_policy"), HistoricalCaseSummary),
+    ],
+)
+def test_class_row_fetchers_select_record_fields(monkeypatch, fake_db, fetch, record_type) -> None:
+    monkeypatch.setattr(macro_event_analysis, "get_pool", lambda: fake_db)
+
+    fetch()
+
+    # class_row passes every output column as a keyword, so the SELECT list
+    # must name exactly the dataclass fields.
+    select_list = fake_db.queries[0].removeprefix("SELECT ").split(" FROM ")[0]
+    columns = [column.strip() for column in select_list.split(",")]
+    assert columns == [field.name for field in dataclasses.fields(record_type)]
+    assert fake_db.row_factories[0] is not None
+
+
+def test_run_analysis_fetches_cases_once_per_batch(monkeypatch) -> None:
+    calls: list[set[str | None]] = []
+
+    def fake_by_types(event_types, *, limit=5):
+        calls.append(set(event_types))
+        return {}
+
+    monkeypatch.setattr(macro_event_analysis, "fetch_metals_knowledge", list)
+    monkeypatch.setattr(macro_event_analysis, "fetch_historical_cases_by_types", fake_by_types)
+
+    events = [_event("monetary_policy"), _event("monetary_policy"), _event(None)]
+    summary = run_analysis(
+        LocalHeuristicProvider(), iter(events), dry_run=True, include_market_context=False
+    )
+
+    assert calls == [{"monetary_policy", None}]
+    assert summary["analyzed"] == 3
+
+
+def test_run_analysis_serializes_metals_once_per_batch(monkeypatch) -> None:
+    metals = [MetalsKnowledgeEntry(metal="gold", category="patterns", content={"trend": "up"})]
+    renders: list[int] = []
+    prompts: list[str] = []
+
+    def fake_format(entries):
+        renders.append(1)
+        return macro_event_analysis._dump_prompt_json(
+            macro_event_analysis._format_metals_knowledge(entries)
+        )
+
+    class _RecordingProvider(LocalHeuristicProvider):
+        def complete_payload(self, prompt: str, **kwargs) -> dict:
+            prompts.append(prompt)
+            return super().complete_payload(prompt, **kwargs)
+
+    monkeypatch.setattr(macro_event_analysis, "fetch_metals_knowledge", lambda: metals)
+    monkeypatch.setattr(macro_event_analysis, "format_metals_json", fake_format)
+    monkeypatch.setattr(
+        macro_event_analysis, "fetch_historical_cases_by_types", lambda types, **_: {}
+    )
+
+    run_analysis(
+        _RecordingProvider(),
+        [_event("monetary_policy"), _event("election")],
+        dry_run=True,
+        include_market_context=False,
+    )
+
+    assert len(renders) == 1
+    assert len(prompts) == 2
+    assert all('METALS_KB_JSON:\n{"gold":{"patterns":{"trend":"up"}}}\n' in p for p in prompts)
+
+
+def test_openrouter_provider_reuses_one_client() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "{}"}}]})
+
+    with OpenRouterProvider(
+        "key",
+        "model",
+        base_url="https://openrouter.test/api/v1/chat/completions",
+        app_title="Meridian",
+        transport=httpx.MockTransport(handler),
+    ) as provider:
+        assert provider.complete("one") == "{}"
+        assert provider.complete("two") == "{}"
+
+    assert len(requests) == 2
+    assert requests[0].headers["Authorization"] == "Bearer key"
+    assert requests[0].headers["X-Title"] == "Meridian"
+    assert json.loads(requests[1].content)["messages"][0]["content"] == "two"
+
+
+def test_openrouter_provider_raises_runtime_error_on_http_error() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(429, text="slow down"))
+    provider = OpenRouterProvider("key", "model", base_url="https://x.test", transport=transport)
+
+    with pytest.raises(RuntimeError, match="429 Too Many Requests. slow down"):
+        provider.complete("prompt")
+
+
+def test_run_analysis_overlaps_provider_calls(monkeypatch) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _BarrierProvider(LocalHeuristicProvider):
+        def complete_payload(self, prompt: str, **kwargs) -> dict:
+            # Deadlocks (and times out) unless both events are in flight at once.
+            barrier.wait()
+            return super().complete_payload(prompt, **kwargs)
+
+    monkeypatch.setattr(macro_event_analysis, "fetch_metals_knowledge", list)
+    monkeypatch.setattr(
+        macro_event_analysis, "fetch_historical_cases_by_types", lambda types, **_: {}
+    )
+
+    summary = run_analysis(
+        _BarrierProvider(),
+        [_event("monetary_policy"), _event("election")],
+        dry_run=True,
+        include_market_context=False,
+        concurrency=2,
+    )
+
+    assert summary["analyzed"] == 2
+
+
+def test_run_analysis_stops_submitting_after_a_provider_failure(monkeypatch) -> None:
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    class _FailingProvider(LocalHeuristicProvider):
+        def complete_payload(self, prompt: str, **kwargs) -> dict:
+            with lock:
+                calls.append(prompt)
+                if len(calls) == 2:
+                    raise RuntimeError("provider down")
+            return super().complete_payload(prompt, **kwargs)
+
+    monkeypatch.setattr(macro_event_analysis, "fetch_metals_knowledge", list)
+    monkeypatch.setattr(
+        macro_event_analysis, "fetch_historical_cases_by_types", lambda types, **_: {}
+    )
+
+    with pytest.raises(RuntimeError, match="provider down"):
+        run_analysis(
+            _FailingProvider(),
+            [_event("monetary_policy") for _ in range(8)],
+            dry_run=True,
+            include_market_context=False,
+            concurrency=2,
+        )
+
+    # Only the bounded window (two in flight plus one refill) was ever submitted.
+    assert len(calls) <= 3
+
+
+def test_parse_analysis_response_leaves_caller_payload_untouched() -> None:
+    payload = {
+        "raw_facts": ["  Spaced   fact ", ""],
+        "metal_impacts": {"gold": {"direction": "up", "confidence": "high"}, "platinum": {}},
+        "historical_precedent": "insufficient data",
+        "counter_case": "insufficient data",
+        "crypto_transmission": {"exists": False},
+    }
+    snapshot = copy.deepcopy(payload)
+
+    analysis = parse_analysis_response(payload)
+
+    assert payload == snapshot
+    assert analysis.raw_facts == ["Spaced fact"]
+    assert analysis.metal_impacts["gold"]["direction"] == "up"
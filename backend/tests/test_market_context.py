@@ -148,6 +148,12 @@ class TestCreditRegimeClassification:
         assert classify_credit_regime(800) == "crisis"
         assert classify_credit_regime(1000) == "crisis"
 
+    def test_out_of_range_values_fall_to_lowest_regime(self):
+        """Negative and NaN readings classify like the lowest bucket."""
+        assert classify_credit_regime(-10) == "tight"
+        assert classify_credit_regime(float("nan")) == "tight"
+        assert classify_volatility_regime(float("nan")) == "calm"
+
 
 class TestRegimeClassificationFromSnapshot:
     """Tests for classify_regimes with MarketSnapshot."""
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+from app.db import seed_cases
 from app.db.seed_cases import load_case_entries
 
 
@@ -14,3 +16,23 @@ def test_load_case_entries_from_repo_data() -> None:
     assert "2008 Global Financial Crisis" in names
     assert "2020 COVID Shock" in names
     assert "2022 Russia-Ukraine War" in names
+
+
+def test_seed_cases_stages_one_row_per_key_last_file_wins(tmp_path, monkeypatch, fake_db) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    payload = json.loads((repo_root / "data" / "cases" / "2008_gfc.json").read_text())
+    (tmp_path / "a.json").write_text(json.dumps(payload))
+    payload["significance_score"] = 1
+    (tmp_path / "b.json").write_text(json.dumps(payload))
+
+    staged: list[tuple[object, ...]] = []
+
+    def _stage_rows(conn, table, columns, rows) -> str:
+        staged.extend(rows)
+        return "historical_cases_staging"
+
+    monkeypatch.setattr(seed_cases, "stage_rows", _stage_rows)
+    monkeypatch.setattr(seed_cases.psycopg, "connect", lambda url: fake_db)
+
+    assert seed_cases.seed_cases(tmp_path) == 2
+    assert [(row[0], row[3]) for row in staged] == [(payload["event_name"], 1)]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+from app.db import seed_metals
 from app.db.seed_metals import ALLOWED_CATEGORIES, ALLOWED_METALS, load_seed_entries
 
 
@@ -16,3 +18,27 @@ def test_load_seed_entries_from_repo_data() -> None:
     for metal in ALLOWED_METALS:
         for category in ALLOWED_CATEGORIES:
             assert (metal, category) in keys
+
+
+def test_seed_metals_stages_one_row_per_key_last_file_wins(tmp_path, monkeypatch, fake_db) -> None:
+    repo_root = Path(__file__).resolve().parents[2]
+    payload = json.loads((repo_root / "data" / "metals" / "gold.json").read_text())
+    (tmp_path / "gold.json").write_text(json.dumps(payload))
+    payload["categories"]["patterns"] = {"source": "extra"}
+    (tmp_path / "gold_extra.json").write_text(json.dumps(payload))
+
+    staged: list[tuple[object, ...]] = []
+
+    def _stage_rows(conn, table, columns, rows) -> str:
+        staged.extend(rows)
+        return "metals_knowledge_staging"
+
+    monkeypatch.setattr(seed_metals, "stage_rows", _stage_rows)
+    monkeypatch.setattr(seed_metals.psycopg, "connect", lambda url: fake_db)
+
+    seed_metals.seed_metals(tmp_path)
+
+    keys = [(metal, category) for metal, category, _content in staged]
+    assert len(keys) == len(set(keys)) == len(ALLOWED_CATEGORIES)
+    patterns = next(row[2] for row in staged if row[1] == "patterns")
+    assert patterns.obj == {"source": "extra"}
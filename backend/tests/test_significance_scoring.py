@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from app.analysis.significance import MacroEvent, classify_score, score_event
+import uuid
+
+from app.analysis import significance
+from app.analysis.significance import (
+    MacroEvent,
+    classify_score,
+    fetch_events_to_score,
+    score_event,
+    update_event_scores,
+)
 
 
 def test_score_event_with_structured_inputs() -> None:
@@ -39,8 +48,50 @@ def test_score_event_infers_event_type_from_text() -> None:
     assert scored.tier == "priority"
 
 
+def test_score_event_shares_baseline_for_unremarkable_events() -> None:
+    quiet = score_event(MacroEvent(source="ap", headline="Quiet session", full_text="No news."))
+
+    assert score_event(MacroEvent(source="ap", headline="Calm trading")) is quiet
+    assert quiet == significance._build_scored_event(None, "quiet session", "ap", 0, 0)
+    assert quiet.total_score == 39
+
+
 def test_classify_score_thresholds() -> None:
     assert classify_score(65) == "priority"
     assert classify_score(64) == "monitoring"
     assert classify_score(50) == "monitoring"
     assert classify_score(49) == "logged"
+
+
+def test_update_event_scores_stages_rows_with_copy(monkeypatch, fake_db) -> None:
+    conn = fake_db
+    monkeypatch.setattr(significance, "get_pool", lambda: conn)
+    events = [
+        MacroEvent(source="ap", headline="Fed raises rates again", id=uuid.uuid4()),
+        MacroEvent(source="ap", headline="Quiet session", id=uuid.uuid4()),
+    ]
+
+    summary = update_event_scores(iter(events))
+
+    assert conn.queries[0].startswith("CREATE TEMP TABLE macro_events_staging")
+    assert conn.queries[1].startswith("COPY macro_events_staging")
+    assert conn.queries[2].startswith("UPDATE macro_events AS m")
+    assert [(row[0], row[1], row[3]) for row in conn.copied] == [
+        (events[0].id, 75, True),
+        (events[1].id, 39, False),
+    ]
+    assert summary == {"priority": 1, "monitoring": 0, "logged": 1}
+
+
+def test_fetch_events_to_score_streams_from_named_cursor(monkeypatch, fake_db) -> None:
+    conn = fake_db
+    conn.result = [(uuid.uuid4(), "ap", "Quiet session", None, None, ["US"], None)]
+    monkeypatch.setattr(significance, "get_pool", lambda: conn)
+
+    events = fetch_events_to_score(limit=10)
+
+    assert conn.queries == []
+    assert [event.headline for event in events] == ["Quiet session"]
+    assert conn.cursor_names == ["score_events"]
+    assert conn.itersize == significance.FETCH_CHUNK_SIZE
+    assert conn.queries[0].endswith("LIMIT %(limit)s")
@@ -169,6 +169,14 @@ class TestGetInstrumentsForHorizon:
         # Should have instruments from both channels
         assert len(instruments) > len(SHORT_TERM_INSTRUMENTS.get("oil_supply_disruption", []))
 
+    def test_deduplicates_across_channels_in_order(self) -> None:
+        instruments = get_instruments_for_horizon(
+            TradeHorizon.SHORT_TERM,
+            ["oil_supply_disruption", "oil_demand_shock", "natural_gas_supply"],
+            max_instruments=5,
+        )
+        assert instruments == ["CL=F", "BZ=F", "USO", "XLE", "NG=F"]
+
 
 class TestDetermineDirectionFromBehavior:
     """Tests for determine_direction_from_behavior function."""
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from app.analysis.transmission import evaluate_transmission, normalize_crypto_transmission
+from app.analysis.transmission import (
+    default_transmission,
+    evaluate_transmission,
+    extract_relevant_assets,
+    normalize_crypto_transmission,
+    normalize_relevant_assets,
+)
 
 
 def test_normalize_crypto_transmission_maps_strength_and_assets() -> None:
@@ -18,3 +24,48 @@ def test_evaluate_transmission_uses_event_type_liquidity_path() -> None:
     assert result["exists"] is True
     assert result["strength"] == "weak"
     assert "BTC" in result["relevant_assets"]
+
+
+def test_relevant_assets_dedupe_preserves_first_seen_order() -> None:
+    assert extract_relevant_assets("ETH rallies; bitcoin, btc and Ether follow eth") == [
+        "ETH",
+        "BTC",
+    ]
+    assert normalize_relevant_assets("tether, USDT, sol, Solana") == ["USDT", "SOL"]
+
+
+def test_extract_relevant_assets_matches_whole_tokens_only() -> None:
+    assert extract_relevant_assets("Solana-based stablecoins; btc2 and ethos ignored") == [
+        "SOL",
+        "stablecoins",
+    ]
+
+
+def test_evaluate_transmission_gates_term_paths_on_event_type() -> None:
+    sanctions = evaluate_transmission("New sanctions target capital flows", "geopolitical")
+    ungated = evaluate_transmission("New sanctions target capital flows", "economic_data")
+
+    assert sanctions["relevant_assets"] == ["stablecoins"]
+    assert ungated["exists"] is False
+
+
+def test_evaluate_transmission_caches_but_returns_independent_copies() -> None:
+    first = evaluate_transmission("Bitcoin slides as risk-off spreads", "Geopolitical")
+    first["relevant_assets"].append("SOL")
+    second = evaluate_transmission("BITCOIN slides as risk-off spreads", "geopolitical")
+
+    assert second["relevant_assets"] == ["BTC"]
+    assert second is not first
+
+
+def test_no_transmission_results_are_independent_dicts() -> None:
+    first = evaluate_transmission("Quarterly earnings beat estimates", None)
+    first["relevant_assets"].append("BTC")
+
+    assert evaluate_transmission("", None) == default_transmission()
+    assert evaluate_transmission("Quarterly earnings beat estimates", None) == {
+        "exists": False,
+        "path": "",
+        "strength": "none",
+        "relevant_assets": [],
+    }